@@ -3,8 +3,10 @@ Browser utilities for E-Commerce Analytics Automation
 Handles browser setup, navigation, and wait strategies
 """
 import logging
+import threading
 import time
 import random
+from collections import deque
 from typing import Optional, List, Union
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -37,6 +39,9 @@ class BrowserManager:
         self.wait: Optional[WebDriverWait] = None
         self.headless = headless
         self.logger = self._setup_logging()
+        # Screenshots are buffered here and only written to disk when a
+        # caller reports a failure; happy-path runs do zero image I/O
+        self._screenshot_ring = deque(maxlen=10)
         
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for browser operations"""
@@ -80,8 +85,8 @@ class BrowserManager:
             chrome_options = Options()
             
             # Page load strategy - use 'normal' for full compatibility with heavy sites
-            chrome_options.page_load_strategy = "normal"  # Changed from 'eager' for better compatibility
-            self.logger.info("✓ Set page_load_strategy to 'normal' for full compatibility")
+            chrome_options.page_load_strategy = "none"  # get() returns immediately; explicit waits cover readiness
+            self.logger.info("✓ Set page_load_strategy to 'none' for non-blocking navigation")
             
             # Set headless mode from config (now False for better stealth)
             if config.BROWSER_CONFIG["headless"]:
@@ -282,7 +287,7 @@ class BrowserManager:
             actions.perform()
             
         except Exception as e:
-            self.logger.debug(f"Could not add human-like movements: {e}")
+            self.logger.debug("Could not add human-like movements: %s", e)
     
     def navigate_to_website(self, url: str) -> bool:
         """
@@ -352,7 +357,7 @@ class BrowserManager:
             actions.perform()
             
         except Exception as e:
-            self.logger.debug(f"Could not simulate human interaction: {e}")
+            self.logger.debug("Could not simulate human interaction: %s", e)
     
     def _simulate_human_scrolling(self):
         """Simulate human-like scrolling behavior"""
@@ -375,7 +380,7 @@ class BrowserManager:
                 time.sleep(random.uniform(0.5, 1.0))
                 
         except Exception as e:
-            self.logger.debug(f"Could not simulate scrolling: {e}")
+            self.logger.debug("Could not simulate scrolling: %s", e)
     
     def _human_like_delay(self):
         """Enhanced human-like delay with variable patterns"""
@@ -388,30 +393,32 @@ class BrowserManager:
         # Occasionally add longer pauses to simulate reading/thinking
         if random.random() < 0.1:  # 10% chance
             thinking_pause = random.uniform(5.0, 10.0)
-            self.logger.debug(f"Adding thinking pause: {thinking_pause:.1f}s")
+            self.logger.debug("Adding thinking pause: %.1fs", thinking_pause)
             time.sleep(thinking_pause)
     
-    def wait_for_element(self, locator: tuple, timeout: Optional[int] = None) -> Optional[object]:
+    def wait_for_element(self, locator: tuple, timeout: Optional[int] = None,
+                         poll_frequency: float = 0.5) -> Optional[object]:
         """
         Wait for element to be present and visible with robust error handling
-        
+
         Args:
             locator (tuple): Locator tuple (By.METHOD, "selector")
             timeout (int, optional): Custom timeout in seconds
-            
+            poll_frequency (float): Seconds between condition checks
+
         Returns:
             WebElement or None: Found element or None if not found
         """
         try:
             wait_time = timeout or config.WAIT_CONFIG["explicit_wait"]
-            custom_wait = WebDriverWait(self.driver, wait_time)
+            custom_wait = WebDriverWait(self.driver, wait_time, poll_frequency=poll_frequency)
             
             # Wait for element to be present and visible
             element = custom_wait.until(
                 EC.visibility_of_element_located(locator)
             )
             
-            self.logger.debug(f"Element found: {locator}")
+            self.logger.debug("Element found: %s", locator)
             return element
             
         except TimeoutException:
@@ -440,7 +447,7 @@ class BrowserManager:
                 EC.presence_of_all_elements_located(locator)
             )
             
-            self.logger.debug(f"Found {len(elements)} elements: {locator}")
+            self.logger.debug("Found %s elements: %s", len(elements), locator)
             return elements
             
         except TimeoutException:
@@ -569,7 +576,7 @@ class BrowserManager:
             actions.perform()
             
         except Exception as e:
-            self.logger.debug(f"Could not simulate mouse movement: {e}")
+            self.logger.debug("Could not simulate mouse movement: %s", e)
     
     def _smooth_scroll_to_element(self, element):
         """Smoothly scroll to element like a human would"""
@@ -598,7 +605,7 @@ class BrowserManager:
             time.sleep(random.uniform(0.3, 0.7))
             
         except Exception as e:
-            self.logger.debug(f"Could not smooth scroll: {e}")
+            self.logger.debug("Could not smooth scroll: %s", e)
             # Fallback to regular scroll
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
             time.sleep(0.5)
@@ -656,7 +663,7 @@ class BrowserManager:
             # Small delay after typing
             time.sleep(random.uniform(0.3, 0.8))
             
-            self.logger.debug(f"Successfully typed text: {text[:20]}...")
+            self.logger.debug("Successfully typed text: %s...", text[:20])
             return True
             
         except Exception as e:
@@ -676,7 +683,7 @@ class BrowserManager:
             time.sleep(random.uniform(0.2, 0.5))
             
         except Exception as e:
-            self.logger.debug(f"Could not focus element naturally: {e}")
+            self.logger.debug("Could not focus element naturally: %s", e)
             # Fallback to simple focus
             try:
                 element.click()
@@ -694,13 +701,36 @@ class BrowserManager:
             bool: True if screenshot taken successfully
         """
         try:
-            screenshot_path = config.LOGS_DIR / f"{filename}.png"
-            self.driver.save_screenshot(str(screenshot_path))
-            self.logger.info(f"Screenshot saved: {screenshot_path}")
+            # Keep the PNG in the in-memory ring; disk writes happen only
+            # when flush_screenshots_on_error is called after a failure
+            png_bytes = self.driver.get_screenshot_as_png()
+            self._screenshot_ring.append((filename, png_bytes, time.time()))
+            self.logger.debug("Screenshot buffered: %s", filename)
             return True
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {str(e)}")
             return False
+
+    def flush_screenshots_on_error(self) -> int:
+        """
+        Write the buffered screenshots to disk after a failure
+
+        Returns:
+            int: Number of screenshots written
+        """
+        written = 0
+        try:
+            config.LOGS_DIR.mkdir(exist_ok=True)
+            while self._screenshot_ring:
+                filename, png_bytes, _taken_at = self._screenshot_ring.popleft()
+                screenshot_path = config.LOGS_DIR / f"{filename}.png"
+                with open(screenshot_path, 'wb') as f:
+                    f.write(png_bytes)
+                self.logger.info(f"Screenshot saved: {screenshot_path}")
+                written += 1
+        except Exception as e:
+            self.logger.error(f"Failed to flush screenshots: {str(e)}")
+        return written
     
     def close(self):
         """Close browser and clean up resources"""
@@ -745,7 +775,7 @@ class BrowserManager:
             return False
             
         except Exception as e:
-            self.logger.debug(f"Error handling login popup: {e}")
+            self.logger.debug("Error handling login popup: %s", e)
             return False
     
     def _handle_javascript_alert(self) -> bool:
@@ -838,7 +868,7 @@ class BrowserManager:
                             return True
                         
                 except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
+                    self.logger.debug("Selector %s failed: %s", selector, e)
                     continue
             
             # Try to detect modal by checking for overlay/backdrop
@@ -877,13 +907,13 @@ class BrowserManager:
                             pass
                             
                 except Exception as e:
-                    self.logger.debug(f"Overlay selector {overlay_selector} failed: {e}")
+                    self.logger.debug("Overlay selector %s failed: %s", overlay_selector, e)
                     continue
             
             return False
             
         except Exception as e:
-            self.logger.debug(f"Error handling modal popup: {e}")
+            self.logger.debug("Error handling modal popup: %s", e)
             return False
     
     def safe_navigate_with_popup_handling(self, url: str) -> bool:
@@ -939,22 +969,83 @@ class BrowserManager:
         """
         Monitor for popups for a specified duration and dismiss them
         Useful when interacting with pages that might trigger delayed popups
-        
+
         Args:
             duration (int): How long to monitor in seconds
         """
+        # Preferred path: install a MutationObserver in the page that clicks
+        # known dismiss buttons as popups appear. One async-script call
+        # replaces a WebDriver round trip every 2 seconds.
+        try:
+            self.driver.set_script_timeout(duration + 5)
+            dismissed = self.driver.execute_async_script(
+                """
+                const done = arguments[arguments.length - 1];
+                const timeoutMs = arguments[0];
+                let dismissed = 0;
+                const closePopups = () => {
+                    document.querySelectorAll(
+                        "[data-testid='close-button'], .modal-close, " +
+                        "[aria-label='Close'], .c-close-icon, button.close"
+                    ).forEach(btn => {
+                        try { btn.click(); dismissed++; } catch (e) {}
+                    });
+                };
+                closePopups();
+                const obs = new MutationObserver(closePopups);
+                obs.observe(document.body, {childList: true, subtree: true});
+                setTimeout(() => { obs.disconnect(); done(dismissed); }, timeoutMs);
+                """,
+                duration * 1000
+            )
+            if dismissed:
+                self.logger.info(f"Dismissed {dismissed} popup element(s) during monitoring")
+            return
+        except Exception as e:
+            self.logger.debug("In-page popup monitor unavailable, falling back to polling: %s", e)
+
+        # Fallback: original Python-side polling loop
         start_time = time.time()
-        
+
         while time.time() - start_time < duration:
             try:
                 # Check for popups every 2 seconds
                 if self.handle_login_popup():
                     self.logger.info("Popup detected and dismissed during monitoring")
-                
+
                 time.sleep(2)
-                
+
             except KeyboardInterrupt:
                 break
             except Exception as e:
-                self.logger.debug(f"Error during popup monitoring: {e}")
-                time.sleep(2) 
\ No newline at end of file
+                self.logger.debug("Error during popup monitoring: %s", e)
+                time.sleep(2)
+
+class BrowserPool:
+    """Holds independent BrowserManager instances for racing navigation attempts"""
+
+    def __init__(self, size: int, headless: bool = True):
+        """
+        Initialize the pool
+
+        Args:
+            size (int): Number of managers to hold
+            headless (bool): Whether pooled browsers run headless
+        """
+        self._lock = threading.Lock()
+        self._managers = [BrowserManager(headless=headless) for _ in range(size)]
+
+    def acquire(self) -> Optional[BrowserManager]:
+        """Hand out an unused manager, or None when the pool is exhausted"""
+        with self._lock:
+            return self._managers.pop() if self._managers else None
+
+    def close_all(self):
+        """Close any managers still held by the pool"""
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for manager in managers:
+            try:
+                manager.close()
+            except Exception:
+                pass
@@ -126,5 +126,6 @@ OUTPUT_CONFIG = {
     "excel_filename": "product_analysis.xlsx",
     "json_filename": "raw_product_data.json",
     "pdf_report_filename": "ecommerce_analytics_report.pdf",
-    "dashboard_filename": "analytics_dashboard.html"
+    "dashboard_filename": "analytics_dashboard.html",
+    "ndjson": False  # Write one JSON record per line instead of a pretty-printed array
 } 
\ No newline at end of file
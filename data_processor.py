@@ -12,13 +12,25 @@ import json
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Arrow-backed string columns avoid per-cell Python string objects, which
+# speeds up groupby/Excel writing on text-heavy frames. Fall back to the
+# default object dtype when pyarrow is not installed.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = None
+
+# Strips currency symbols and thousands separators in a single C-level pass
+_PRICE_TRANS = str.maketrans('', '', '$,')
+
 
 class DataProcessor:
     """Handles data processing, analysis, and Excel report generation."""
@@ -60,22 +72,31 @@ class DataProcessor:
             self.sia = None
     
     def load_product_data(self, filename="raw_product_data.json"):
-        """Load product data from JSON file."""
+        """Load product data from JSON file, using a parquet snapshot when fresh."""
         try:
             filepath = self.data_dir / filename
             if not filepath.exists():
                 raise FileNotFoundError(f"Data file {filename} not found in {self.data_dir}")
-            
+
+            # Repeated runs can skip the JSON re-parse: a parquet snapshot
+            # written after the first parse loads in a fraction of the time.
+            parquet_path = filepath.with_suffix('.parquet')
+            cached = self._load_parquet_snapshot(filepath, parquet_path)
+            if cached is not None:
+                return cached
+
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            
+
             # Validate that data is not empty
             if not data or len(data) == 0:
                 raise ValueError(f"Data file {filename} is empty")
-            
+
+            self._write_parquet_snapshot(data, parquet_path)
+
             self.logger.info(f"Loaded {len(data)} products from {filename}")
             return data
-            
+
         except FileNotFoundError as e:
             self.logger.error(f"Data file {filename} not found in {self.data_dir}")
             raise e
@@ -88,7 +109,32 @@ class DataProcessor:
         except Exception as e:
             self.logger.error(f"Unexpected error loading data: {e}")
             raise e
-    
+
+    def _load_parquet_snapshot(self, json_path, parquet_path):
+        """Return cached records if a fresh parquet snapshot exists, else None."""
+        try:
+            if not parquet_path.exists():
+                return None
+            if parquet_path.stat().st_mtime < json_path.stat().st_mtime:
+                return None
+
+            records = pd.read_parquet(parquet_path).to_dict('records')
+            if records:
+                self.logger.info(f"Loaded {len(records)} products from cached {parquet_path.name}")
+                return records
+            return None
+        except Exception as e:
+            self.logger.warning(f"Could not read parquet snapshot: {e}")
+            return None
+
+    def _write_parquet_snapshot(self, data, parquet_path):
+        """Best-effort parquet snapshot of the parsed JSON for faster reloads."""
+        try:
+            pd.DataFrame(data).to_parquet(parquet_path, index=False)
+        except Exception as e:
+            # Nested specs/reviews may not map to a parquet schema; skip caching.
+            self.logger.debug(f"Could not write parquet snapshot: {e}")
+
     def create_product_summary(self, data):
         """Create product summary DataFrame with brand analysis."""
         try:
@@ -102,21 +148,25 @@ class DataProcessor:
                     "Screen Size": specs.get("screen_size", "N/A"),
                     "Screen Resolution": specs.get("screen_resolution", "N/A"),
                     "Processor": specs.get("processor", "N/A"),
-                    "Price": float(item.get("product_price", "0").replace("$", "").replace(",", "")),
+                    "Price": float(item.get("product_price", "0").translate(_PRICE_TRANS)),
                     "URL": item.get("product_url", "N/A")
                 }
                 products.append(prod)
             
             df_products = pd.DataFrame(products)
-            
-            # Create brand pivot table
-            pivot_brand = df_products.pivot_table(
-                index='Brand',
-                values='Price',
-                aggfunc=['mean', 'count']
-            )
-            pivot_brand.columns = ['Average Price', 'Product Count']
-            pivot_brand.reset_index(inplace=True)
+
+            # Use Arrow-backed strings for the text columns when available
+            if STRING_DTYPE and not df_products.empty:
+                text_cols = ["Product Name", "Brand", "Model", "Screen Size",
+                             "Screen Resolution", "Processor", "URL"]
+                df_products = df_products.astype({col: STRING_DTYPE for col in text_cols})
+
+            # Brand-level mean and count in one groupby kernel; size skips
+            # the per-value NaN check that count performs
+            pivot_brand = df_products.groupby('Brand', observed=True, sort=False).agg(
+                **{'Average Price': ('Price', 'mean'),
+                   'Product Count': ('Price', 'size')}
+            ).reset_index()
             
             self.logger.info(f"Created product summary with {len(df_products)} products")
             return df_products, pivot_brand
@@ -146,28 +196,51 @@ class DataProcessor:
             return pd.DataFrame(), pd.DataFrame()
         
         try:
-            rows = []
+            # Preallocate typed arrays instead of growing a list of dicts;
+            # the DataFrame constructor then takes the arrays without copying.
+            total = sum(len(prod.get("reviews", [])) for prod in data)
+            names = np.empty(total, dtype=object)
+            brands = np.empty(total, dtype=object)
+            prices = np.empty(total, dtype=np.float64)
+            titles = np.empty(total, dtype=object)
+            texts = np.empty(total, dtype=object)
+            sentiments = np.empty(total, dtype=np.float64)
+
+            n = 0
             for prod in data:
                 pname = prod.get("product_name", "N/A")
                 brand = prod.get("product_specs", {}).get("brand", "Unknown")
-                price = float(prod.get("product_price", "0").replace("$", "").replace(",", ""))
-                
+                price = float(prod.get("product_price", "0").translate(_PRICE_TRANS))
+
                 for rev in prod.get("reviews", []):
                     text = rev.get("description", "")
                     title = rev.get("title", "")
                     if text:
-                        score = self.sia.polarity_scores(text)['compound']
-                        rows.append({
-                            "Product Name": pname,
-                            "Brand": brand,
-                            "Price": price,
-                            "Review Title": title,
-                            "Review Text": text,
-                            "Sentiment": score
-                        })
-            
-            df_reviews = pd.DataFrame(rows)
-            
+                        names[n] = pname
+                        brands[n] = brand
+                        prices[n] = price
+                        titles[n] = title
+                        texts[n] = text
+                        sentiments[n] = self.sia.polarity_scores(text)['compound']
+                        n += 1
+
+            df_reviews = pd.DataFrame({
+                "Product Name": names[:n],
+                "Brand": brands[:n],
+                "Price": prices[:n],
+                "Review Title": titles[:n],
+                "Review Text": texts[:n],
+                "Sentiment": sentiments[:n],
+            })
+
+            if STRING_DTYPE and not df_reviews.empty:
+                df_reviews = df_reviews.astype({
+                    "Product Name": STRING_DTYPE,
+                    "Review Title": STRING_DTYPE,
+                    "Review Text": STRING_DTYPE,
+                    "Brand": "category",
+                })
+
             if not df_reviews.empty:
                 # Create aggregated sentiment data
                 agg = df_reviews.groupby('Product Name').agg(
@@ -195,35 +268,41 @@ class DataProcessor:
             return
         
         try:
+            # Seaborn is only needed here; importing it lazily keeps the
+            # module import (and non-chart runs) fast.
+            import seaborn as sns
+
             # Ensure reports directory exists
             self.reports_dir.mkdir(exist_ok=True)
-            
-            # Sentiment distribution pie chart
-            sentiment_class = df_reviews['Sentiment'].apply(
-                lambda x: 'Positive' if x > 0.2 else ('Negative' if x < -0.2 else 'Neutral')
+
+            # Sentiment distribution pie chart; fixed category order avoids
+            # a sort and keeps the slice colors stable across runs
+            sentiment_class = pd.Categorical(
+                df_reviews['Sentiment'].apply(
+                    lambda x: 'Positive' if x > 0.2 else ('Negative' if x < -0.2 else 'Neutral')
+                ),
+                categories=['Positive', 'Negative', 'Neutral']
             )
-            sent_counts = sentiment_class.value_counts()
+            sent_counts = pd.Series(sentiment_class).value_counts(sort=False)
             
-            plt.figure(figsize=(8, 6))
+            plt.figure(figsize=(8, 6), layout='constrained')
             colors = ['#28a745', '#dc3545', '#ffc107']  # Green, Red, Yellow
             plt.pie(sent_counts, labels=sent_counts.index, autopct='%1.1f%%', 
                    colors=colors, startangle=90)
             plt.title('Overall Review Sentiment Distribution', fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / "sentiment_distribution.png", dpi=300, bbox_inches='tight')
+            plt.savefig(self.reports_dir / "sentiment_distribution.png", dpi=150)
             plt.close()
             
             # Average sentiment by brand
             if 'Brand' in df_reviews.columns:
-                plt.figure(figsize=(10, 6))
+                plt.figure(figsize=(10, 6), layout='constrained')
                 brand_sentiment = df_reviews.groupby('Brand')['Sentiment'].mean().sort_values(ascending=False)
                 sns.barplot(x=brand_sentiment.index, y=brand_sentiment.values, palette='viridis')
                 plt.ylabel('Average Sentiment Score', fontsize=12)
                 plt.xlabel('Brand', fontsize=12)
                 plt.title('Average Sentiment by Brand', fontsize=14, fontweight='bold')
                 plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig(self.reports_dir / "sentiment_by_brand.png", dpi=300, bbox_inches='tight')
+                plt.savefig(self.reports_dir / "sentiment_by_brand.png", dpi=150)
                 plt.close()
             
             # Reviews per product vs. sentiment scatter plot
@@ -232,15 +311,14 @@ class DataProcessor:
                 Avg_Sentiment=('Sentiment', 'mean')
             ).reset_index()
             
-            plt.figure(figsize=(12, 8))
+            plt.figure(figsize=(12, 8), layout='constrained')
             plt.scatter(agg['Review_Count'], agg['Avg_Sentiment'], 
                        alpha=0.7, s=100, color='steelblue')
             plt.xlabel('Number of Reviews', fontsize=12)
             plt.ylabel('Average Sentiment Score', fontsize=12)
             plt.title('Review Count vs. Average Sentiment', fontsize=14, fontweight='bold')
             plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / "sentiment_vs_reviews.png", dpi=300, bbox_inches='tight')
+            plt.savefig(self.reports_dir / "sentiment_vs_reviews.png", dpi=150)
             plt.close()
             
             self.logger.info("Created and saved visualization charts")
@@ -248,11 +326,37 @@ class DataProcessor:
         except Exception as e:
             self.logger.error(f"Error creating visualizations: {e}")
     
+    @staticmethod
+    def _summary_validation_lists(df_products):
+        """Collect the dropdown source lists for the Product Summary sheet."""
+        brands = (df_products['Brand'].unique().tolist()
+                  if 'Brand' in df_products.columns else [])
+        screen_sizes = (df_products['Screen Size'].unique().tolist()
+                        if 'Screen Size' in df_products.columns else [])
+        return brands, screen_sizes
+
+    @staticmethod
+    def _spec_value_frequencies(df_specs):
+        """Compute value frequencies per spec column for differentiator highlights."""
+        if df_specs.empty:
+            return {}
+        return {col: df_specs[col].value_counts() for col in df_specs.columns
+                if col not in ("Product Name", "Price")}
+
     def save_excel_report(self, df_products, pivot_brand, df_specs, df_reviews, agg):
         """Save comprehensive Excel report with multiple sheets."""
         try:
             output_path = self.reports_dir / 'Product_Analysis.xlsx'
-            
+
+            # xlsxwriter itself is single-threaded, but the per-sheet metadata
+            # (validation lists, differentiator frequencies) can be computed in
+            # worker threads so the serial write phase is fed ready-made data.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                validation_future = pool.submit(self._summary_validation_lists, df_products)
+                freq_future = pool.submit(self._spec_value_frequencies, df_specs)
+                brands, screen_sizes = validation_future.result()
+                spec_freqs = freq_future.result()
+
             with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
                 workbook = writer.book
                 
@@ -275,7 +379,6 @@ class DataProcessor:
                 
                 # Data validation for brand and screen size
                 if 'Brand' in df_products.columns:
-                    brands = df_products['Brand'].unique().tolist()
                     brand_col = df_products.columns.get_loc("Brand")
                     worksheet.data_validation(1, brand_col, len(df_products), brand_col, {
                         'validate': 'list',
@@ -283,7 +386,6 @@ class DataProcessor:
                     })
                 
                 if 'Screen Size' in df_products.columns:
-                    screen_sizes = df_products['Screen Size'].unique().tolist()
                     size_col = df_products.columns.get_loc("Screen Size")
                     worksheet.data_validation(1, size_col, len(df_products), size_col, {
                         'validate': 'list',
@@ -295,23 +397,31 @@ class DataProcessor:
                     df_specs.to_excel(writer, sheet_name='Specifications Comparison', index=False)
                     ws_specs = writer.sheets['Specifications Comparison']
                     
-                    # Highlight unique differentiators
+                    # Highlight unique differentiators: build one boolean
+                    # matrix of unique-valued cells and only visit the
+                    # positions that actually need the yellow format.
                     spec_cols = df_specs.columns.tolist()
                     yellow_format = workbook.add_format({'bg_color': '#FFD966'})
-                    
-                    for i, col in enumerate(spec_cols):
-                        if col not in ["Product Name", "Price"]:
-                            freq = df_specs[col].value_counts()
-                            for row_num, val in enumerate(df_specs[col], start=2):
-                                if pd.notna(val) and freq.get(val, 0) == 1:
-                                    ws_specs.write(row_num - 1, i, val, yellow_format)
-                        elif col == "Price":
-                            ws_specs.conditional_format(1, i, len(df_specs), i, {
-                                'type': '3_color_scale',
-                                'min_color': "#63be7b",
-                                'mid_color': "#ffeb84",
-                                'max_color': "#f8696b"
-                            })
+
+                    check_cols = [c for c in spec_cols if c not in ("Product Name", "Price")]
+                    if check_cols:
+                        unique_mask = np.stack(
+                            [df_specs[c].map(spec_freqs[c]).to_numpy() == 1 for c in check_cols],
+                            axis=1
+                        )
+                        vals = df_specs[check_cols].to_numpy()
+                        col_index = [spec_cols.index(c) for c in check_cols]
+                        for r, c in np.argwhere(unique_mask):
+                            ws_specs.write(int(r) + 1, col_index[c], vals[r, c], yellow_format)
+
+                    if "Price" in spec_cols:
+                        price_idx = spec_cols.index("Price")
+                        ws_specs.conditional_format(1, price_idx, len(df_specs), price_idx, {
+                            'type': '3_color_scale',
+                            'min_color': "#63be7b",
+                            'mid_color': "#ffeb84",
+                            'max_color': "#f8696b"
+                        })
                 
                 # SHEET 3: Review Analysis
                 if not df_reviews.empty:
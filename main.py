@@ -2,64 +2,446 @@
 E-Commerce Analytics Automation - Main Application
 Demonstrates initial setup and navigation functionality
 """
+import argparse
+import atexit
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as futures_wait
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler
+import re
 import sys
 import json
 import time
+
+try:
+    # C-extension JSON encoder, typically 5-10x faster than stdlib and
+    # UTF-8 native; the stdlib path below is used when it is not installed
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, ClassVar
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from bs4 import BeautifulSoup
 
 # Import our custom modules
 import config
-from browser_utils import BrowserManager
+from browser_utils import BrowserManager, BrowserPool
+
+# Selector registries shared by verification and navigation, pre-tagged
+# with their By strategy so call sites never sniff the selector syntax
+# Content keywords matched locally against the parsed (lowercased) page
+# text; a single compiled alternation scans each string once at C level
+# instead of a Python `in` check per keyword
+_CONTENT_TEXT_RE = re.compile(r"laptop|computer|macbook|notebook")
+# Keyword alternations compiled once: one C-level scan of the URL/title
+# instead of a Python generator issuing a separate `in` check per keyword
+_URL_KEYWORDS_RE = re.compile(r"laptop|computer|abcat0502000|pc")
+_TITLE_KEYWORDS_RE = re.compile(r"laptop|computer|pc|notebook")
+# Extraction patterns compiled once instead of per product in the
+# rating/review/price fallback loops
+_RE_INT = re.compile(r"(\d+)")
+_RE_FLOAT = re.compile(r"(\d+\.?\d*)")
+_RE_PAREN_INT = re.compile(r"\(?(\d+)\)?")
+_RE_PRICE = re.compile(r"\$[\d,]+\.?\d*")
+# Specification patterns compiled once instead of per product tile
+_RE_SCREEN_INCH = re.compile(r'(\d+\.?\d*)\s*(?:inch|")')
+# Single alternation over all spec categories: one pass over the tile text
+# instead of five separate findall scans, with the named group telling us
+# which category each term belongs to
+_SPECS_RE = re.compile(
+    r'(?P<screen>\d+\.?\d*\s*(?:inch|"))'
+    r'|(?P<ram>\d+\s*GB\s*(?:RAM|Memory|DDR\d?))'
+    r'|(?P<storage>\d+\s*(?:GB|TB)\s*(?:SSD|HDD|Storage))'
+    r'|(?P<cpu>Intel\s+Core\s+i\d+|AMD\s+Ryzen\s+\d+)'
+    r'|(?P<os>Windows\s+\d+|macOS|Chrome\s*OS)',
+    re.IGNORECASE,
+)
+_CONTENT_INDICATORS = tuple((By.XPATH, x) for x in (
+    # Product-related indicators
+    "//div[contains(@class, 'product')]",
+    "//div[contains(@class, 'item')]",
+    "//article",
+    # Category page indicators
+    "//div[contains(@class, 'category')]",
+    "//div[contains(@class, 'listing')]",
+    "//div[contains(@class, 'results')]",
+))
+_PRODUCT_SELECTORS = tuple((By.CSS_SELECTOR, s) for s in (
+    ".product",
+    ".item",
+    "[data-testid*='product']",
+    ".sku-item",
+    ".list-item",
+))
+_MENU_SELECTORS = (
+    (By.XPATH, "//a[contains(text(), 'Computer')]"),
+    (By.XPATH, "//a[contains(text(), 'Laptop')]"),
+    (By.XPATH, "//span[contains(text(), 'Computer')]"),
+    (By.XPATH, "//span[contains(text(), 'Laptop')]"),
+    (By.CSS_SELECTOR, "[data-automation-id*='computer']"),
+    (By.CSS_SELECTOR, "[data-automation-id*='laptop']"),
+)
+
+# Filter and extraction selector tables, built once at import instead of
+# per call inside the fallback loops. CSS is used wherever the pattern is
+# expressible without XPath's text() matching, since querySelector avoids
+# the slower XPath engine
+_PRICE_XPATHS = (
+    (By.XPATH, "//button[contains(text(), 'Price')]"),
+    (By.CSS_SELECTOR, "button[aria-label*='Price']"),
+    (By.XPATH, "//div[contains(@class, 'facet')]//span[contains(text(), 'Price')]"),
+    (By.XPATH, "//span[contains(text(), 'Price Range')]"),
+    (By.XPATH, "//*[contains(text(), '$500') and contains(text(), '$1500')]"),
+    (By.CSS_SELECTOR, "input[placeholder='Min'], input[placeholder='min']"),
+)
+_BRAND_XPATHS = (
+    (By.XPATH, "//button[contains(text(), 'Brand')]"),
+    (By.XPATH, "//span[contains(text(), 'Brand')]//parent::button"),
+    (By.XPATH, "//div[contains(@class, 'facet')]//span[contains(text(), 'Brand')]"),
+    (By.CSS_SELECTOR, "button[aria-label*='Brand']"),
+)
+# Compound unions over the filter tables: one 5-second wait covers every
+# alternative instead of a 5-second wait per candidate
+_PRICE_XPATH_UNION = " | ".join(s for by, s in _PRICE_XPATHS if by == By.XPATH)
+_PRICE_CSS_UNION = ", ".join(s for by, s in _PRICE_XPATHS if by == By.CSS_SELECTOR)
+_BRAND_XPATH_UNION = " | ".join(s for by, s in _BRAND_XPATHS if by == By.XPATH)
+_BRAND_CSS_UNION = ", ".join(s for by, s in _BRAND_XPATHS if by == By.CSS_SELECTOR)
+_RATING_CSS = (
+    # Best Buy specific rating selectors
+    ".sr-rating",
+    ".rating",
+    ".rating-stars",
+    "[data-testid='rating']",
+    ".stars",
+    ".c-rating",
+    ".sr-rating__score",
+    ".average-rating",
+)
+_RATING_XPATHS = (
+    ".//*[contains(@aria-label, 'star') or contains(@title, 'star')]",
+    ".//*[contains(@aria-label, 'rating') or contains(@title, 'rating')]",
+    ".//*[contains(@class, 'rating') or contains(@class, 'star')]",
+)
+_REVIEW_CSS_FALLBACKS = (
+    ".c-reviews",
+    ".review-count",
+    ".reviews-count",
+    "[data-testid='review-count']",
+    ".reviews",
+    ".number-of-reviews",
+)
+_REVIEW_XPATH_FALLBACKS = (
+    ".//*[contains(text(), 'review') and contains(text(), '(')]",
+    ".//*[contains(text(), 'Review') and contains(text(), '(')]",
+    ".//*[contains(@aria-label, 'review')]",
+    ".//*[contains(@title, 'review')]",
+)
+_NAME_CSS_FALLBACKS = (
+    ".product-title",
+    "h2",
+    "h3",
+    "h4",
+    "[data-testid='product-title']",
+)
+_PRICE_CSS_FALLBACKS = (
+    ".customer-price",
+    ".price",
+    ".current-price",
+    ".pricing-current-price",
+    "[data-testid='price']",
+)
+# In-page lazy-load scroll: keeps scrolling to the bottom and resolves as
+# soon as no new product cards arrive within the settle window, so the
+# scroll phase costs the true lazy-load time instead of a fixed floor of
+# sleep-gated round trips
+_LAZY_SCROLL_JS = """
+const done = arguments[arguments.length - 1];
+const maxMs = arguments[0];
+const settleMs = arguments[1];
+const countCards = () => document.querySelectorAll('.product-list-item').length;
+const target = document.getElementById('main-results') || document.body;
+let lastCount = countCards();
+let finished = false;
+let settleTimer = null;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    obs.disconnect();
+    clearInterval(scroller);
+    clearTimeout(settleTimer);
+    done(countCards());
+};
+const obs = new MutationObserver(() => {
+    const count = countCards();
+    if (count > lastCount) {
+        lastCount = count;
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(finish, settleMs);
+    }
+});
+obs.observe(target, {childList: true, subtree: true});
+const scroller = setInterval(
+    () => window.scrollTo(0, document.body.scrollHeight), 250);
+settleTimer = setTimeout(finish, settleMs);
+setTimeout(finish, maxMs);
+"""
+
+# Bulk grid extraction: one script call returns the raw fields for every
+# product card at once, so the whole grid costs a single wire round trip
+# instead of one (or six) per product
+_BULK_PRODUCTS_JS = (
+    "let cards = document.querySelectorAll('#main-results .product-list-item');"
+    "if (!cards.length) cards = document.querySelectorAll('.product-list-item');"
+    "return Array.from(cards).slice(0, arguments[0]).map((el, i) => {"
+    "  const q = s => el.querySelector(s);"
+    "  const t = n => n ? n.innerText.trim() : null;"
+    "  return {"
+    "    index: i,"
+    "    name: t(q('h2.product-title')),"
+    "    price: t(q('div.customer-price')),"
+    "    rating: t(q('.sr-rating')),"
+    "    reviews: t(q('span.c-reviews')),"
+    "    url: (q(\"a[href*='/site/']\") || q('a') || {}).href || null,"
+    "    text: el.innerText.trim()"
+    "  };"
+    "});"
+)
+
+# Same grid mapping packaged as a self-contained Runtime.evaluate
+# expression: one CDP message instead of a WebDriver JSON-over-HTTP hop,
+# with the whole array handed back by value as a JSON string (the limit
+# is interpolated because CDP expressions take no arguments)
+_BULK_PRODUCTS_CDP_JS = (
+    "JSON.stringify((() => {"
+    "let cards = document.querySelectorAll('#main-results .product-list-item');"
+    "if (!cards.length) cards = document.querySelectorAll('.product-list-item');"
+    "return Array.from(cards).slice(0, %d).map((el, i) => {"
+    "  const q = s => el.querySelector(s);"
+    "  const t = n => n ? n.innerText.trim() : null;"
+    "  return {"
+    "    index: i,"
+    "    name: t(q('h2.product-title')),"
+    "    price: t(q('div.customer-price')),"
+    "    rating: t(q('.sr-rating')),"
+    "    reviews: t(q('span.c-reviews')),"
+    "    url: (q(\"a[href*='/site/']\") || q('a') || {}).href || null,"
+    "    text: el.innerText.trim()"
+    "  };"
+    "});"
+    "})())"
+)
+
+# Fused per-product field probe: every querySelector lookup runs inside
+# the page so one execute_script call replaces six find_element round
+# trips (each of which walks its own fallback list)
+_PRODUCT_FIELDS_JS = (
+    "const el = arguments[0];"
+    "const q = s => el.querySelector(s);"
+    "const t = n => n ? n.innerText.trim() : null;"
+    "return {"
+    "  name: t(q('h2.product-title')),"
+    "  price: t(q('div.customer-price')),"
+    "  rating: t(q('.sr-rating')),"
+    "  reviews: t(q('span.c-reviews')),"
+    "  url: (q(\"a[href*='/site/']\") || q('a') || {}).href || null,"
+    "  text: el.innerText.trim()"
+    "};"
+)
+_ALT_PRODUCT_CSS = (
+    "div[class*='product']",
+    "div[class*='item']",
+    "article",
+    "div[class*='card']",
+    "[class*='sku']",
+)
+
+# Expected Best Buy identifiers, lowercased once at import
+_BB_DOMAIN = "bestbuy.com"
+_BB_TITLE = "best buy"
+
+# Shared logging objects, built once at import rather than per analyzer
+# instance (formatters are safe to share across handlers)
+_LOG_FORMATTER = logging.Formatter(config.LOGGING_CONFIG["format"])
+_LOG_LEVEL = getattr(logging, config.LOGGING_CONFIG["level"])
+
+# Self-healing selector registry: the selector that worked last run is
+# tried first on the next one, so steady-state discovery costs one
+# attempt instead of walking the full candidate list
+_SELECTOR_CACHE_PATH = config.DATA_DIR / "selectors.json"
+
+
+def _load_selector_cache() -> Dict[str, Any]:
+    """Load the persisted role → winning-selector map, if present"""
+    try:
+        with open(_SELECTOR_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+_SELECTOR_CACHE = _load_selector_cache()
+
+
+def _cached_first(role: str, candidates):
+    """
+    Yield selector candidates with the cached winner for this role first
+
+    Args:
+        role (str): Cache key describing what the selector locates
+        candidates: Iterable of selector descriptors to fall back on
+    """
+    cached = _SELECTOR_CACHE.get(role)
+    if cached is None:
+        yield from candidates
+        return
+    winner = tuple(cached) if isinstance(cached, list) else cached
+    yield winner
+    for candidate in candidates:
+        if candidate != winner:
+            yield candidate
+
+
+def _record_selector_win(role: str, winner) -> None:
+    """Persist the selector that worked so the next run tries it first"""
+    entry = list(winner) if isinstance(winner, tuple) else winner
+    if _SELECTOR_CACHE.get(role) == entry:
+        return
+    _SELECTOR_CACHE[role] = entry
+    try:
+        _SELECTOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_SELECTOR_CACHE_PATH, "w") as f:
+            json.dump(_SELECTOR_CACHE, f, indent=2)
+    except Exception:
+        pass  # Cache persistence is best-effort
+
+
+# Wait-strategy demo table: (display name, description, composite probe key,
+# fallback method name). Frozen at module scope so each call avoids
+# rebuilding dicts and lambda closures.
+_WAIT_TESTS = (
+    ("Implicit Wait", "Default wait for elements to appear",
+     "implicit", "_test_implicit_wait"),
+    ("Explicit Wait", "Wait for specific conditions",
+     "body", "_test_explicit_wait"),
+    ("Page Load Wait", "Wait for complete page loading",
+     "ready", "_test_page_load_wait"),
+    ("Dynamic Content Wait", "Wait for dynamically loaded content",
+     "dynamic", "_test_dynamic_content_wait"),
+)
 
 class ECommerceAnalyzer:
     """Main class for e-commerce analytics automation"""
-    
-    def __init__(self, headless: bool = True):
+
+    # Selector tables allocated once at class creation instead of per call.
+    # Page-load verification selectors live as one CSS union so a single
+    # browser-side lookup covers every pattern (header variants, nav).
+    _VERIFICATION_UNION_CSS: ClassVar[str] = \
+        ".sr-header, [data-automation-id='header'], .header-wrapper, nav, header"
+    _DYNAMIC_SELECTORS: ClassVar[tuple] = (
+        (By.TAG_NAME, "footer"),
+        (By.CSS_SELECTOR, "[data-automation-id]"),
+        (By.CLASS_NAME, "container"),
+        (By.TAG_NAME, "main"),
+    )
+
+
+    def __init__(self, headless: bool = True, fast: bool = False):
         """
         Initialize the e-commerce analyzer
-        
+
         Args:
             headless (bool): Whether to run browser in headless mode
+            fast (bool): Skip the wait-strategies demonstration for a quicker run
         """
-        self.browser_manager: Optional[BrowserManager] = None
+        # Constructed eagerly (cheap: no browser is launched until
+        # initialize_browser) so methods need no None guards
+        self.browser_manager = BrowserManager(headless=headless)
+        # Cached driver handle, set by initialize_browser; avoids the
+        # browser_manager.driver double attribute lookup on every command
+        self._driver = None
         self.headless = headless
+        self.fast = fast
+        self._cleaned = False
         self.logger = self._setup_logging()
+        # Single worker keeps screenshots ordered while taking the PNG
+        # encode and disk write off the navigation critical path
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ecom-io")
+        # Per-field winning selectors for the current page: on a
+        # homogeneous product grid the same fallback wins for every card,
+        # so try it first instead of rewalking the list per product
+        self._winning_selector: Dict[str, str] = {}
+        # Output path computed once; saves re-joining and re-mkdir-ing on
+        # every save call
+        config.DATA_DIR.mkdir(exist_ok=True)
+        self._json_path = config.DATA_DIR / config.OUTPUT_CONFIG["json_filename"]
         
+    # Set once the shared logger has handlers attached; later instances
+    # skip the handler checks entirely
+    _logging_configured = False
+
     def _setup_logging(self) -> logging.Logger:
         """Setup application logging"""
         logger = logging.getLogger("ECommerceAnalyzer")
-        logger.setLevel(getattr(logging, config.LOGGING_CONFIG["level"]))
-        
+        if ECommerceAnalyzer._logging_configured:
+            return logger
+
+        logger.setLevel(_LOG_LEVEL)
+
         if not logger.handlers:
             # Create logs directory if it doesn't exist
             config.LOGS_DIR.mkdir(exist_ok=True)
-            
+
             # File handler
             file_handler = logging.FileHandler(
                 config.LOGS_DIR / config.LOGGING_CONFIG["file_name"]
             )
-            file_handler.setFormatter(
-                logging.Formatter(config.LOGGING_CONFIG["format"])
+            file_handler.setFormatter(_LOG_FORMATTER)
+
+            # Buffer file writes so log-heavy loops issue one large write
+            # per 512 records instead of a syscall per record; errors and
+            # shutdown flush immediately
+            buffered_handler = MemoryHandler(
+                capacity=512,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
             )
-            
-            # Console handler
+            atexit.register(buffered_handler.flush)
+
+            # Console handler stays unbuffered so output remains live
             console_handler = logging.StreamHandler()
-            console_handler.setFormatter(
-                logging.Formatter(config.LOGGING_CONFIG["format"])
-            )
-            
-            logger.addHandler(file_handler)
+            console_handler.setFormatter(_LOG_FORMATTER)
+
+            logger.addHandler(buffered_handler)
             logger.addHandler(console_handler)
-            
+
+        ECommerceAnalyzer._logging_configured = True
         return logger
     
+    def _prepare_run_directories(self) -> None:
+        """Create the output directories while the browser is booting"""
+        try:
+            for directory in (config.DATA_DIR, config.LOGS_DIR, config.REPORTS_DIR):
+                directory.mkdir(exist_ok=True)
+        except Exception as e:
+            self.logger.debug("Directory preparation failed: %s", str(e))
+
+    def _warm_selector_cache(self) -> None:
+        """Refresh the selector cache from disk while the browser is booting"""
+        try:
+            _SELECTOR_CACHE.update(_load_selector_cache())
+        except Exception as e:
+            self.logger.debug("Selector cache warm-up failed: %s", str(e))
+
     def initialize_browser(self) -> bool:
         """
         Initialize browser with robust setup
@@ -68,15 +450,27 @@ class ECommerceAnalyzer:
             bool: True if initialization successful
         """
         try:
+            # Idempotent: when a session is already live (e.g. opened by
+            # the context manager) there is nothing to launch
+            if self._driver:
+                return True
+
             self.logger.info("=== Starting E-Commerce Analytics Automation ===")
             self.logger.info("Task 1: Initial Setup and Navigation")
-            
-            # Initialize browser manager
-            self.browser_manager = BrowserManager(headless=self.headless)
-            
-            # Setup Chrome browser
-            driver = self.browser_manager.setup_browser()
-            
+
+            # Chrome spawn takes seconds and is independent of the
+            # Python-side warm-up, so run it in a worker thread and do the
+            # directory/cache preparation while it boots
+            spawn = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-spawn")
+            try:
+                driver_future = spawn.submit(self.browser_manager.setup_browser)
+                self._prepare_run_directories()
+                self._warm_selector_cache()
+                driver = driver_future.result()
+            finally:
+                spawn.shutdown(wait=False)
+            self._driver = driver
+
             if driver:
                 self.logger.info("✓ Chrome browser initialized successfully")
                 self.logger.info(f"✓ Browser running in {'headless' if self.headless else 'visible'} mode")
@@ -97,7 +491,7 @@ class ECommerceAnalyzer:
             bool: True if navigation successful
         """
         try:
-            if not self.browser_manager or not self.browser_manager.driver:
+            if not self._driver:
                 self.logger.error("Browser not initialized")
                 return False
 
@@ -132,56 +526,105 @@ class ECommerceAnalyzer:
         """
         try:
             self.logger.info("Verifying page load with robust wait strategies...")
-            
-            # Check for common Best Buy elements to verify page loaded
-            verification_selectors = [
-                (By.CLASS_NAME, "sr-header"),  # Best Buy header
-                (By.CSS_SELECTOR, "[data-automation-id='header']"),  # Header automation ID
-                (By.CLASS_NAME, "header-wrapper"),  # Header wrapper
-                (By.TAG_NAME, "nav"),  # Navigation element
-                (By.CSS_SELECTOR, "header"),  # Generic header
-            ]
-            
+
+            # Happy path: if the document is already complete and the title
+            # matches, skip the selector wait entirely (one script call
+            # instead of several WebDriver commands). The title is folded
+            # once here and reused by the later checks
+            page_title = None
+            lc_title = None
+            try:
+                state, page_title, _url = self._driver.execute_script(
+                    "return [document.readyState, document.title, location.href]"
+                )
+                lc_title = page_title.casefold()
+                if state == "complete" and _BB_TITLE in lc_title:
+                    self.logger.info("✓ Page already complete with expected title - verification passed")
+                    self._io_pool.submit(self.browser_manager.take_screenshot, "successful_navigation")
+                    return True
+            except Exception as e:
+                self.logger.debug("Ready-state short-circuit failed: %s", str(e))
+
             page_verified = False
-            
-            for selector in verification_selectors:
-                element = self.browser_manager.wait_for_element(selector, timeout=15)
+            page_info = None
+
+            # Evaluate every verification selector in one browser-side
+            # query: a single polled execute_script replaces five 15-second
+            # wait_for_element round trips (worst case ~75s of serialized
+            # WebDriver commands)
+            union_selector = self._VERIFICATION_UNION_CSS
+            try:
+                page_info = WebDriverWait(
+                    self._driver, 15, poll_frequency=0.25
+                ).until(lambda d: d.execute_script(
+                    "var el = document.querySelector(arguments[0]);"
+                    "return el ? {title: document.title, url: location.href} : null;",
+                    union_selector
+                ))
+                self.logger.info(f"✓ Page verification successful - Found match for: {union_selector}")
+                page_verified = True
+            except TimeoutException:
+                self.logger.debug("No verification element matched: %s", union_selector)
+            except Exception as e:
+                # Browser-side query unavailable; one wait_for_element on
+                # the CSS union still covers every selector in one lookup
+                self.logger.debug("Browser-side selector check failed: %s", str(e))
+                element = self.browser_manager.wait_for_element(
+                    (By.CSS_SELECTOR, union_selector), timeout=15, poll_frequency=0.25
+                )
                 if element:
-                    self.logger.info(f"✓ Page verification successful - Found element: {selector}")
+                    self.logger.info(
+                        f"✓ Page verification successful - Found element: <{element.tag_name}>"
+                    )
                     page_verified = True
-                    break
                 else:
-                    self.logger.debug(f"Element not found: {selector}")
-            
+                    self.logger.debug("No verification element found: %s", union_selector)
+
             if not page_verified:
                 # Take screenshot for debugging
                 self.logger.warning("Could not verify specific elements, but page might have loaded")
-                self.browser_manager.take_screenshot("page_verification_failed")
+                self._io_pool.submit(self.browser_manager.take_screenshot, "page_verification_failed")
                 
-                # Check if we're on the right domain at least
-                current_url = self.browser_manager.driver.current_url
-                if "bestbuy.com" in current_url.lower():
+                # Check if we're on the right domain at least; lowercasing
+                # happens browser-side on the short hostname rather than on
+                # the full URL string in Python
+                hostname = self._driver.execute_script(
+                    "return location.hostname.toLowerCase()"
+                )
+                if hostname.endswith(_BB_DOMAIN):
                     self.logger.info("✓ Page verification: We're on Best Buy domain")
                     page_verified = True
                 else:
-                    self.logger.error(f"✗ Unexpected URL: {current_url}")
+                    self.logger.error(f"✗ Unexpected hostname: {hostname}")
             
-            # Additional verification: Check page title
-            try:
-                page_title = self.browser_manager.driver.title
-                self.logger.info(f"Page title: {page_title}")
-                
-                if "best buy" in page_title.lower():
-                    self.logger.info("✓ Page title verification successful")
-                    page_verified = True
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not verify page title: {str(e)}")
+            # Additional verification: only consult the title when nothing
+            # above verified the page, reusing the already-folded title
+            # from the short-circuit probe when it was captured
+            if not page_verified:
+                try:
+                    if lc_title is None:
+                        if page_info:
+                            page_title = page_info["title"]
+                        else:
+                            info = self._driver.execute_script(
+                                "return {t: document.title, u: location.href}"
+                            )
+                            page_title = info["t"]
+                        lc_title = page_title.casefold()
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Page title: %s", page_title)
+
+                    if _BB_TITLE in lc_title:
+                        self.logger.info("✓ Page title verification successful")
+                        page_verified = True
+
+                except Exception as e:
+                    self.logger.warning(f"Could not verify page title: {str(e)}")
             
             if page_verified:
                 self.logger.info("✓ Page load verification completed successfully")
-                # Take a success screenshot
-                self.browser_manager.take_screenshot("successful_navigation")
+                # Take a success screenshot (deferred to the I/O worker)
+                self._io_pool.submit(self.browser_manager.take_screenshot, "successful_navigation")
             else:
                 self.logger.error("✗ Page load verification failed")
                 
@@ -201,47 +644,41 @@ class ECommerceAnalyzer:
         try:
             self.logger.info("Demonstrating robust wait strategies for dynamic elements...")
             
-            if not self.browser_manager or not self.browser_manager.driver:
+            if not self._driver:
                 self.logger.error("Browser not initialized")
                 return False
             
-            # Test different wait strategies
-            wait_tests = [
-                {
-                    "name": "Implicit Wait",
-                    "description": "Default wait for elements to appear",
-                    "test": lambda: self._test_implicit_wait()
-                },
-                {
-                    "name": "Explicit Wait",
-                    "description": "Wait for specific conditions",
-                    "test": lambda: self._test_explicit_wait()
-                },
-                {
-                    "name": "Page Load Wait",
-                    "description": "Wait for complete page loading",
-                    "test": lambda: self._test_page_load_wait()
-                },
-                {
-                    "name": "Dynamic Content Wait",
-                    "description": "Wait for dynamically loaded content",
-                    "test": lambda: self._test_dynamic_content_wait()
-                }
-            ]
-            
+            # One polled script answers every probe at once, collapsing four
+            # independent wait loops into a single stream of poll commands;
+            # the per-test helpers remain as a fallback
+            probe_results = None
+            try:
+                probe_results = WebDriverWait(
+                    self._driver, 30, poll_frequency=0.5
+                ).until(lambda d: d.execute_script(
+                    "var r = {implicit: true,"
+                    " body: document.body !== null,"
+                    " ready: document.readyState === 'complete',"
+                    " dynamic: document.querySelector("
+                    "'footer, [data-automation-id], .container, main') !== null};"
+                    "return (r.body && r.ready) ? r : null;"
+                ))
+            except Exception as e:
+                self.logger.debug("Composite wait probe unavailable, running tests individually: %s", str(e))
+
             all_tests_passed = True
-            
-            for test in wait_tests:
-                self.logger.info(f"Testing: {test['name']} - {test['description']}")
+
+            for name, description, key, fn_name in _WAIT_TESTS:
+                self.logger.info(f"Testing: {name} - {description}")
                 try:
-                    result = test["test"]()
+                    result = probe_results[key] if probe_results else getattr(self, fn_name)()
                     if result:
-                        self.logger.info(f"✓ {test['name']} test passed")
+                        self.logger.info(f"✓ {name} test passed")
                     else:
-                        self.logger.warning(f"⚠ {test['name']} test failed")
+                        self.logger.warning(f"⚠ {name} test failed")
                         all_tests_passed = False
                 except Exception as e:
-                    self.logger.error(f"✗ {test['name']} test error: {str(e)}")
+                    self.logger.error(f"✗ {name} test error: {str(e)}")
                     all_tests_passed = False
             
             if all_tests_passed:
@@ -268,7 +705,9 @@ class ECommerceAnalyzer:
         """Test explicit wait for specific elements"""
         try:
             # Test waiting for body element (should always exist)
-            element = self.browser_manager.wait_for_element((By.TAG_NAME, "body"), timeout=10)
+            element = self.browser_manager.wait_for_element(
+                (By.TAG_NAME, "body"), timeout=10, poll_frequency=0.25
+            )
             return element is not None
         except Exception:
             return False
@@ -276,28 +715,58 @@ class ECommerceAnalyzer:
     def _test_page_load_wait(self) -> bool:
         """Test page load wait strategies"""
         try:
-            return self.browser_manager.wait_for_page_load(timeout=30)
+            driver = self._driver
+            try:
+                # With the CDP Page domain enabled, load completion is pushed
+                # over the devtools socket, so a tight readyState poll
+                # resolves almost immediately after the load event instead
+                # of waiting out a coarse polling interval
+                if not getattr(self, "_cdp_page_enabled", False):
+                    driver.execute_cdp_cmd("Page.enable", {})
+                    self._cdp_page_enabled = True
+                WebDriverWait(driver, 30, poll_frequency=0.1).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+                return True
+            except Exception:
+                # Non-Chromium drivers keep the original polling helper
+                return self.browser_manager.wait_for_page_load(timeout=30)
         except Exception:
             return False
     
+    @staticmethod
+    def _build_union_selector(selectors) -> str:
+        """Translate a list of (By, value) pairs into one comma-joined CSS selector"""
+        parts = []
+        for by, value in selectors:
+            if by == By.CLASS_NAME:
+                parts.append(f".{value}")
+            elif by == By.ID:
+                parts.append(f"#{value}")
+            else:
+                # By.TAG_NAME and By.CSS_SELECTOR values are already valid CSS
+                parts.append(value)
+        return ", ".join(parts)
+
     def _test_dynamic_content_wait(self) -> bool:
         """Test waiting for dynamic content"""
         try:
             # Look for elements that might be loaded dynamically
-            selectors_to_test = [
-                (By.TAG_NAME, "footer"),
-                (By.CSS_SELECTOR, "[data-automation-id]"),
-                (By.CLASS_NAME, "container"),
-                (By.TAG_NAME, "main")
-            ]
-            
-            for selector in selectors_to_test:
-                element = self.browser_manager.wait_for_element(selector, timeout=5)
-                if element:
-                    self.logger.debug(f"Found dynamic element: {selector}")
-                    return True
-            
-            return False
+            selectors_to_test = self._DYNAMIC_SELECTORS
+
+            # One query over the devtools socket checks every selector at
+            # once instead of a 5s explicit wait per selector
+            union = self._build_union_selector(selectors_to_test)
+            expression = f"document.querySelector('{union}') !== null"
+            try:
+                result = self._driver.execute_cdp_cmd(
+                    "Runtime.evaluate",
+                    {"expression": expression, "returnByValue": True}
+                )
+                return bool(result["result"]["value"])
+            except Exception:
+                # Non-Chromium drivers: run the same query through WebDriver
+                return bool(self._driver.execute_script(f"return {expression}"))
         except Exception:
             return False
     
@@ -314,7 +783,7 @@ class ECommerceAnalyzer:
             self.logger.info("=== Task 2: Product Category Analysis ===")
             self.logger.info("Navigating to laptops category...")
             
-            if not self.browser_manager or not self.browser_manager.driver:
+            if not self._driver:
                 self.logger.error("Browser not initialized")
                 return False
             
@@ -324,7 +793,18 @@ class ECommerceAnalyzer:
                 self._navigate_via_menu_click,
                 self._navigate_via_search
             ]
-            
+
+            # Race the approaches on independent browsers so a slow or
+            # failing direct-URL attempt doesn't block the others
+            try:
+                if self._race_navigation_approaches(approaches):
+                    self.logger.info("✓ Successfully navigated to laptops category")
+                    self.browser_manager.take_screenshot("laptops_category_page")
+                    return True
+            except Exception as e:
+                self.logger.warning(f"Parallel navigation unavailable: {str(e)}")
+
+            # Sequential fallback on the main browser
             for i, approach in enumerate(approaches, 1):
                 try:
                     self.logger.info(f"Trying approach {i}: {approach.__name__}")
@@ -346,44 +826,134 @@ class ECommerceAnalyzer:
         except Exception as e:
             self.logger.error(f"✗ Error navigating to laptops category: {str(e)}")
             return False
-    
-    def _navigate_via_direct_url(self) -> bool:
+
+    def _race_navigation_approaches(self, approaches) -> bool:
+        """
+        Run each navigation approach against its own browser and keep the
+        first one that succeeds as the analyzer's main session
+
+        Args:
+            approaches: Navigation methods accepting a BrowserManager
+
+        Returns:
+            bool: True if any approach won the race
+        """
+        pool = BrowserPool(len(approaches), headless=self.headless)
+        winner = None
+
+        def run(approach):
+            manager = pool.acquire()
+            if manager is None:
+                return None
+            try:
+                if not manager.setup_browser():
+                    return None
+                if approach is not self._navigate_via_direct_url:
+                    # Menu and search approaches start from the home page
+                    manager.safe_navigate_with_popup_handling(config.WEBSITE_CONFIG["base_url"])
+                if approach(manager):
+                    return manager
+                manager.close()
+                return None
+            except Exception:
+                try:
+                    manager.close()
+                except Exception:
+                    pass
+                return None
+
+        def close_late_winner(fut):
+            # A browser that succeeds after the race is decided gets closed
+            try:
+                manager = fut.result()
+                if manager is not None and manager is not self.browser_manager:
+                    manager.close()
+            except Exception:
+                pass
+
+        executor = ThreadPoolExecutor(max_workers=len(approaches), thread_name_prefix="nav-race")
+        try:
+            futures = {executor.submit(run, approach): approach.__name__
+                       for approach in approaches}
+            pending = set(futures)
+            while pending and winner is None:
+                done, pending = futures_wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    manager = fut.result()
+                    if manager is not None and winner is None:
+                        winner = manager
+                        self.logger.info(f"✓ {futures[fut]} won the navigation race")
+            for fut in pending:
+                fut.add_done_callback(close_late_winner)
+        finally:
+            executor.shutdown(wait=False)
+
+        if winner is None:
+            pool.close_all()
+            return False
+
+        # Promote the winning browser to be the main session
+        previous = self.browser_manager
+        self.browser_manager = winner
+        self._driver = winner.driver
+        try:
+            previous.close()
+        except Exception:
+            pass
+        pool.close_all()
+        return True
+
+    def _navigate_via_direct_url(self, manager: Optional[BrowserManager] = None) -> bool:
         """Navigate directly to laptops URL"""
         try:
+            manager = manager or self.browser_manager
+            driver = manager.driver
             # Use the specific URL provided by user
             laptops_url = "https://www.bestbuy.com/site/computers-pcs/laptop-computers/abcat0502000.c?id=abcat0502000"
             self.logger.info(f"Navigating directly to: {laptops_url}")
             
-            # Set a longer page load timeout for this navigation
-            self.browser_manager.driver.set_page_load_timeout(60)
-            
-            self.browser_manager.driver.get(laptops_url)
-            
-            # Wait for page to start loading
-            time.sleep(5)
-            
-            # Reset timeout
-            self.browser_manager.driver.set_page_load_timeout(30)
-            
-            # Wait longer for page to start loading
-            time.sleep(10)
-            
-            # Check if main-results div is already loaded (skip country selection if so)
-            self.logger.info("Checking if main-results div is already loaded...")
-            main_results_already_loaded = False
+            # CDP navigation returns immediately instead of blocking inside
+            # driver.get() until ad/tracking requests settle; the waits
+            # below then cover only the elements we actually need
+            navigated = False
             try:
-                main_results_check = WebDriverWait(self.browser_manager.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "main-results"))
+                driver.execute_cdp_cmd("Page.enable", {})
+                driver.execute_cdp_cmd("Page.navigate", {"url": laptops_url})
+                navigated = True
+            except Exception as e:
+                self.logger.debug("CDP navigation unavailable, using driver.get: %s", str(e))
+
+            if not navigated:
+                # With pageLoadStrategy 'none' this returns immediately;
+                # the element wait below covers readiness
+                driver.get(laptops_url)
+
+            # Wait for whichever meaningful element appears first — the
+            # results container or the country-selection modal — in one
+            # call instead of separate readyState / main-results /
+            # country-modal waits stacked back to back
+            self.logger.info("Waiting for main-results or country selection...")
+            try:
+                WebDriverWait(driver, 45).until(
+                    EC.any_of(
+                        EC.presence_of_element_located((By.ID, "main-results")),
+                        EC.element_to_be_clickable(
+                            (By.XPATH, "//h4[contains(text(), 'United States')]")
+                        ),
+                    )
                 )
-                if main_results_check:
-                    self.logger.info("✓ main-results div already loaded - skipping country selection")
-                    country_handled = True  # Skip country selection
-                    main_results_already_loaded = True
-                else:
-                    country_handled = False
             except TimeoutException:
+                self.logger.info("Neither main-results nor country selection appeared within 45s")
+
+            # Skip country selection when the results container already won
+            if driver.find_elements(By.ID, "main-results"):
+                self.logger.info("✓ main-results div already loaded - skipping country selection")
+                country_handled = True
+                main_results_already_loaded = True
+            else:
                 self.logger.info("main-results div not found yet - will attempt country selection")
                 country_handled = False
+                main_results_already_loaded = False
             
             # Handle country selection only if main-results div is not loaded
             if not country_handled:
@@ -395,7 +965,7 @@ class ECommerceAnalyzer:
                     
                     try:
                         # Look for United States element with longer wait
-                        us_element = WebDriverWait(self.browser_manager.driver, 15).until(
+                        us_element = WebDriverWait(driver, 15).until(
                             EC.element_to_be_clickable((By.XPATH, "//h4[contains(text(), 'United States')]"))
                         )
                         
@@ -403,20 +973,27 @@ class ECommerceAnalyzer:
                             self.logger.info("✓ Found 'United States' element")
                             
                             # Take screenshot before clicking
-                            self.browser_manager.take_screenshot("before_country_selection")
+                            manager.take_screenshot("before_country_selection")
                             
                             # Scroll to element and click
-                            self.browser_manager.driver.execute_script("arguments[0].scrollIntoView(true);", us_element)
+                            driver.execute_script("arguments[0].scrollIntoView(true);", us_element)
                             time.sleep(2)
                             
                             us_element.click()
                             self.logger.info("✓ Clicked on 'United States'")
-                            
-                            # Wait for navigation to complete
-                            time.sleep(10)
-                            
+
+                            # The click navigates away: wait for the old
+                            # element to go stale instead of a fixed pause
+                            try:
+                                WebDriverWait(driver, 20).until(
+                                    EC.staleness_of(us_element)
+                                )
+                            except TimeoutException:
+                                self.logger.info("Country selection page did not refresh within 20s")
+
+
                             # Take screenshot after clicking
-                            self.browser_manager.take_screenshot("after_country_selection")
+                            manager.take_screenshot("after_country_selection")
                             
                             country_handled = True
                             break
@@ -432,66 +1009,82 @@ class ECommerceAnalyzer:
             else:
                 self.logger.info("Skipped country selection - main-results already available")
             
-            # Wait additional time for the main page to load after country selection (or if already loaded)
+            # Wait for the results container itself rather than a fixed pause
+            main_results_confirmed = main_results_already_loaded
             if country_handled and not main_results_already_loaded:
                 self.logger.info("Waiting for main page to load after country selection...")
-                time.sleep(15)
+                try:
+                    WebDriverWait(driver, 20).until(
+                        EC.presence_of_element_located((By.ID, "main-results"))
+                    )
+                    main_results_confirmed = True
+                except TimeoutException:
+                    self.logger.info("main-results not present yet, proceeding to verification")
             else:
                 self.logger.info("Page already loaded, proceeding to product extraction...")
-                time.sleep(5)  # Shorter wait since page is already loaded
-            
+
+            # We navigated to a known laptops URL and the results container is
+            # present — full page verification would only repeat that work
+            if main_results_confirmed:
+                self.logger.info("✓ main-results confirmed on known laptops URL - skipping full verification")
+                return True
+
             # Check if we're on a laptops page
-            return self._verify_laptops_page()
+            return self._verify_laptops_page(driver)
             
         except Exception as e:
-            self.logger.debug(f"Direct URL navigation failed: {str(e)}")
+            self.logger.debug("Direct URL navigation failed: %s", str(e))
             return False
     
-    def _navigate_via_menu_click(self) -> bool:
+    def _navigate_via_menu_click(self, manager: Optional[BrowserManager] = None) -> bool:
         """Navigate by clicking through the menu"""
         try:
+            manager = manager or self.browser_manager
+            driver = manager.driver
             self.logger.info("Trying to navigate via menu clicks...")
             
-            # Look for computers/laptops menu items
-            menu_selectors = [
-                "//a[contains(text(), 'Computer')]",
-                "//a[contains(text(), 'Laptop')]",
-                "//span[contains(text(), 'Computer')]",
-                "//span[contains(text(), 'Laptop')]",
-                "[data-automation-id*='computer']",
-                "[data-automation-id*='laptop']"
-            ]
-            
-            for selector in menu_selectors:
+            # Look for computers/laptops menu items, trying last run's
+            # winning selector first. A URL change marks the click that
+            # worked; full page verification runs once after the loop
+            # instead of once per selector attempt
+            clicked_selector = None
+            for by, selector in _cached_first("laptops_menu", _MENU_SELECTORS):
                 try:
-                    if selector.startswith("//"):
-                        element = WebDriverWait(self.browser_manager.driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, selector))
-                        )
-                    else:
-                        element = WebDriverWait(self.browser_manager.driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                    
+                    element = WebDriverWait(driver, 5).until(
+                        EC.element_to_be_clickable((by, selector))
+                    )
+
+
+                    pre_click_url = driver.current_url
                     element.click()
-                    time.sleep(3)
-                    
-                    # Check if we're on a laptops page
-                    if self._verify_laptops_page():
-                        return True
-                        
+                    try:
+                        WebDriverWait(driver, 10).until(
+                            EC.url_changes(pre_click_url)
+                        )
+                        clicked_selector = (by, selector)
+                        break
+                    except TimeoutException:
+                        continue
+
                 except (TimeoutException, NoSuchElementException):
                     continue
-            
+
+            # Check if we're on a laptops page
+            if clicked_selector and self._verify_laptops_page(driver):
+                _record_selector_win("laptops_menu", clicked_selector)
+                return True
+
             return False
             
         except Exception as e:
-            self.logger.debug(f"Menu navigation failed: {str(e)}")
+            self.logger.debug("Menu navigation failed: %s", str(e))
             return False
     
-    def _navigate_via_search(self) -> bool:
+    def _navigate_via_search(self, manager: Optional[BrowserManager] = None) -> bool:
         """Navigate by searching for laptops"""
         try:
+            manager = manager or self.browser_manager
+            driver = manager.driver
             self.logger.info("Trying to navigate via search...")
             
             # Look for search box
@@ -503,12 +1096,13 @@ class ECommerceAnalyzer:
                 '.search-input'
             ]
             
-            for selector in search_selectors:
+            for selector in _cached_first("search_input", search_selectors):
                 try:
-                    search_box = WebDriverWait(self.browser_manager.driver, 5).until(
+                    search_box = WebDriverWait(driver, 5).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
-                    
+                    _record_selector_win("search_input", selector)
+
                     search_box.clear()
                     search_box.send_keys("laptops")
                     
@@ -520,128 +1114,157 @@ class ECommerceAnalyzer:
                         '#search-btn'
                     ]
                     
+                    # A URL change marks a submitted search; verify the
+                    # results page once afterwards rather than per attempt
+                    searched = False
                     for btn_selector in search_button_selectors:
                         try:
-                            search_button = self.browser_manager.driver.find_element(By.CSS_SELECTOR, btn_selector)
+                            pre_search_url = driver.current_url
+                            search_button = driver.find_element(By.CSS_SELECTOR, btn_selector)
                             search_button.click()
-                            time.sleep(5)
-                            
-                            # Check if we have laptop results
-                            if self._verify_laptops_page():
-                                return True
-                                
+                            try:
+                                WebDriverWait(driver, 10).until(
+                                    EC.url_changes(pre_search_url)
+                                )
+                                searched = True
+                                break
+                            except TimeoutException:
+                                continue
+
                         except NoSuchElementException:
                             continue
-                    
-                    # Try pressing Enter if no button found
-                    search_box.send_keys(Keys.RETURN)
-                    time.sleep(5)
-                    
-                    if self._verify_laptops_page():
+
+                    if not searched:
+                        # Try pressing Enter if no button worked
+                        pre_search_url = driver.current_url
+                        search_box.send_keys(Keys.RETURN)
+                        try:
+                            WebDriverWait(driver, 10).until(
+                                EC.url_changes(pre_search_url)
+                            )
+                            searched = True
+                        except TimeoutException:
+                            pass
+
+                    # Check if we have laptop results
+                    if searched and self._verify_laptops_page(driver):
                         return True
-                        
+
                 except (TimeoutException, NoSuchElementException):
                     continue
             
             return False
             
         except Exception as e:
-            self.logger.debug(f"Search navigation failed: {str(e)}")
+            self.logger.debug("Search navigation failed: %s", str(e))
             return False
     
-    def _verify_laptops_page(self) -> bool:
+    def _verify_laptops_page(self, driver=None) -> bool:
         """
         Verify that we're on the laptops category page
-        
+
+        Args:
+            driver: Driver to verify; defaults to the main session
+
         Returns:
             bool: True if verification successful
         """
         try:
+            driver = driver or self._driver
+
             # Wait a moment for the page to load
             time.sleep(2)
-            
+
             # Check URL contains laptops-related keywords
-            current_url = self.browser_manager.driver.current_url.lower()
-            url_keywords = ["laptop", "computer", "abcat0502000", "pc"]
-            
-            if any(keyword in current_url for keyword in url_keywords):
+            current_url = driver.current_url.lower()
+
+            if _URL_KEYWORDS_RE.search(current_url):
                 self.logger.info(f"✓ URL verification: On laptops-related page ({current_url})")
                 return True
+
+            # Check page title (.title does not raise on a loaded page, so
+            # no defensive try/except; lowered once and reused)
+            page_title = driver.title.lower()
+
+            if _TITLE_KEYWORDS_RE.search(page_title):
+                self.logger.info(f"✓ Title verification: On laptops page ({page_title})")
+                return True
             
-            # Check page title
+            # Look for laptop-related content: fetch the DOM once and match
+            # the keywords locally with str.lower() instead of asking the
+            # browser to run translate() case-folding XPaths over every node
             try:
-                page_title = self.browser_manager.driver.title.lower()
-                title_keywords = ["laptop", "computer", "pc", "notebook"]
-                
-                if any(keyword in page_title for keyword in title_keywords):
-                    self.logger.info(f"✓ Title verification: On laptops page ({page_title})")
+                html = driver.execute_script("return document.body.outerHTML")
+                soup = BeautifulSoup(html, "html.parser")
+                heading_text = " ".join(
+                    h.get_text(" ", strip=True) for h in soup.find_all(["h1", "h2", "h3"])
+                ).lower()
+                if _CONTENT_TEXT_RE.search(heading_text):
+                    self.logger.info(f"✓ Content verification: Found laptop-related content")
+                    return True
+                if any(
+                    _CONTENT_TEXT_RE.search(text)
+                    for text in (s.lower() for s in soup.stripped_strings)
+                    if len(text) > 5
+                ):
+                    self.logger.info(f"✓ Content verification: Found laptop-related content")
                     return True
             except Exception:
                 pass
-            
-            # Look for laptop-related content on the page
-            content_indicators = [
-                # Text-based indicators
-                "//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'laptop')]",
-                "//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'computer')]",
-                "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'laptop')]",
-                "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'macbook')]",
-                "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'notebook')]",
-                
-                # Product-related indicators
-                "//div[contains(@class, 'product')]",
-                "//div[contains(@class, 'item')]",
-                "//article",
-                
-                # Category page indicators
-                "//div[contains(@class, 'category')]",
-                "//div[contains(@class, 'listing')]",
-                "//div[contains(@class, 'results')]"
-            ]
-            
-            for xpath in content_indicators:
-                try:
-                    elements = self.browser_manager.driver.find_elements(By.XPATH, xpath)
-                    if elements:
-                        # For text-based indicators, check if we have reasonable content
-                        if "laptop" in xpath.lower() or "computer" in xpath.lower():
-                            for element in elements[:3]:  # Check first few elements
-                                text = element.text.strip().lower()
-                                if text and len(text) > 5:  # Has some meaningful text
-                                    self.logger.info(f"✓ Content verification: Found laptop-related content")
-                                    return True
-                        # For structural indicators, just check if we have enough elements
-                        elif len(elements) >= 3:
+
+            # Structural indicators: evaluate all XPaths in the page and
+            # bring back the counts in one packed result instead of a
+            # WebDriver round trip per probe
+            find_elements = driver.find_elements  # LOAD_FAST in fallback loop
+            try:
+                probe_counts = driver.execute_script(
+                    "return arguments[0].map(xp => {"
+                    "  try {"
+                    "    return document.evaluate(xp, document, null,"
+                    "      XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;"
+                    "  } catch (e) { return 0; }"
+                    "});",
+                    [xpath for _, xpath in _CONTENT_INDICATORS]
+                )
+            except Exception:
+                probe_counts = None
+
+            if probe_counts is not None:
+                # Structural indicators only need enough matching elements
+                if any(count >= 3 for count in probe_counts):
+                    self.logger.info(f"✓ Structure verification: Found product page structure")
+                    return True
+            else:
+                # Fallback: probe each indicator with its own WebDriver call
+                for by, xpath in _CONTENT_INDICATORS:
+                    try:
+                        elements = find_elements(by, xpath)
+                        if len(elements) >= 3:
                             self.logger.info(f"✓ Structure verification: Found product page structure")
                             return True
-                except Exception:
-                    continue
+                    except Exception:
+                        continue
             
             # Check if we have any products visible (could be any products)
-            product_selectors = [
-                ".product",
-                ".item",
-                "[data-testid*='product']",
-                ".sku-item",
-                ".list-item"
-            ]
-            
-            for selector in product_selectors:
+            for by, selector in _PRODUCT_SELECTORS:
                 try:
-                    products = self.browser_manager.driver.find_elements(By.CSS_SELECTOR, selector)
+                    products = find_elements(by, selector)
                     if len(products) >= 5:  # Reasonable number of products
                         self.logger.info(f"✓ Product verification: Found {len(products)} products on page")
                         return True
                 except Exception:
                     continue
             
-            # If we're here, we might be on a search results page or similar
-            # Check if page looks like it has e-commerce content
+            # If we're here, we might be on a search results page or similar.
+            # Scan for e-commerce keywords in the browser: page_source would
+            # ship the multi-MB DOM over the wire just to run substring
+            # checks, while this returns a single count
             try:
-                page_source = self.browser_manager.driver.page_source.lower()
-                commerce_keywords = ["price", "$", "buy", "add to cart", "rating", "review"]
-                keyword_count = sum(1 for keyword in commerce_keywords if keyword in page_source)
-                
+                keyword_count = driver.execute_script(
+                    "const t = document.body.innerText.toLowerCase();"
+                    "return ['price', '$', 'buy', 'add to cart', 'rating', 'review']"
+                    ".filter(k => t.includes(k)).length;"
+                )
                 if keyword_count >= 3:
                     self.logger.info(f"✓ Commerce verification: Page has e-commerce content")
                     return True
@@ -649,8 +1272,9 @@ class ECommerceAnalyzer:
                 pass
             
             self.logger.warning("Could not verify laptops page with any method")
-            # Take a screenshot for debugging
-            self.browser_manager.take_screenshot("page_verification_debug")
+            # Take a screenshot for debugging (main session only)
+            if driver is self._driver:
+                self.browser_manager.take_screenshot("page_verification_debug")
             return False
             
         except Exception as e:
@@ -715,70 +1339,102 @@ class ECommerceAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Error applying filters: {str(e)}")
+            # Persist the buffered screenshots now that something failed
+            self.browser_manager.flush_screenshots_on_error()
             return False
     
-    def _apply_price_filter(self) -> bool:
-        """Apply price range filter ($500-$1500)"""
-        try:
-            price_selectors = [
-                "//button[contains(text(), 'Price')]",
-                "//button[contains(@aria-label, 'Price')]",
-                "//div[contains(@class, 'facet')]//span[contains(text(), 'Price')]",
-                "//span[contains(text(), 'Price Range')]",
-                "//*[contains(text(), '$500') and contains(text(), '$1500')]",
-                "//input[@placeholder='Min' or @placeholder='min']"
-            ]
-            
-            for selector in price_selectors:
-                try:
-                    element = WebDriverWait(self.browser_manager.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
+    def _snapshot_results_state(self):
+        """
+        Capture the result-count badge and product count before a filter click
+
+        Returns:
+            tuple: (badge element or None, current product card count)
+        """
+        badges = self._driver.find_elements(By.CSS_SELECTOR, ".result-count")
+        pre_count = len(self._driver.find_elements(By.CSS_SELECTOR, ".product-list-item"))
+        return (badges[0] if badges else None, pre_count)
+
+    def _wait_for_filter_response(self, old_badge, pre_count: int, timeout: float = 10) -> None:
+        """
+        Wait for the result list to react to a filter click
+
+        Prefers staleness of the result-count badge; falls back to polling
+        for a product-count change when no badge exists. Replaces the old
+        fixed 2-second pause, which both over-waited on fast pages and
+        under-waited on slow ones.
+
+        Args:
+            old_badge: Pre-click .result-count element, or None
+            pre_count: Pre-click .product-list-item count
+            timeout: Maximum seconds to wait
+        """
+        try:
+            if old_badge is not None:
+                WebDriverWait(self._driver, timeout).until(EC.staleness_of(old_badge))
+                return
+            WebDriverWait(self._driver, timeout, poll_frequency=0.25).until(
+                lambda d: len(
+                    d.find_elements(By.CSS_SELECTOR, ".product-list-item")
+                ) != pre_count
+            )
+        except TimeoutException:
+            self.logger.debug("No visible result change after filter click within %ss", timeout)
+
+    def _apply_price_filter(self) -> bool:
+        """Apply price range filter ($500-$1500)"""
+        try:
+            # One compound wait covers every candidate; worst-case discovery
+            # drops from a 5s wait per selector to a single 5s wait
+            try:
+                element = WebDriverWait(self._driver, 5).until(
+                    EC.any_of(
+                        EC.element_to_be_clickable((By.XPATH, _PRICE_XPATH_UNION)),
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, _PRICE_CSS_UNION)),
                     )
-                    element.click()
-                    time.sleep(2)
-                    self.logger.debug(f"Clicked price filter: {selector}")
-                    return True
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
+                )
+                old_badge, pre_count = self._snapshot_results_state()
+                element.click()
+                self._wait_for_filter_response(old_badge, pre_count)
+                self.logger.debug("Clicked price filter via compound selector")
+                return True
+            except (TimeoutException, NoSuchElementException):
+                pass
+
             self.logger.debug("No price filter found - this is common on category pages")
             return False
             
         except Exception as e:
-            self.logger.debug(f"Price filter error: {str(e)}")
+            self.logger.debug("Price filter error: %s", str(e))
             return False
     
     def _apply_brand_filter(self) -> bool:
         """Apply brand filter for top manufacturers"""
         try:
-            # Look for brand filters
-            brand_selectors = [
-                "//button[contains(text(), 'Brand')]",
-                "//span[contains(text(), 'Brand')]//parent::button",
-                "//div[contains(@class, 'facet')]//span[contains(text(), 'Brand')]",
-                "//button[contains(@aria-label, 'Brand')]"
-            ]
-            
-            for selector in brand_selectors:
-                try:
-                    element = WebDriverWait(self.browser_manager.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
+            # Look for brand filters with one compound wait over every
+            # candidate instead of a 5s wait per selector
+            try:
+                element = WebDriverWait(self._driver, 5).until(
+                    EC.any_of(
+                        EC.element_to_be_clickable((By.XPATH, _BRAND_XPATH_UNION)),
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, _BRAND_CSS_UNION)),
                     )
-                    element.click()
-                    time.sleep(2)
-                    
-                    # Try to select some brands
-                    self._select_brand_options()
-                    return True
-                    
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
+                )
+                old_badge, pre_count = self._snapshot_results_state()
+                element.click()
+                self._wait_for_filter_response(old_badge, pre_count)
+
+                # Try to select some brands
+                self._select_brand_options()
+                return True
+
+            except (TimeoutException, NoSuchElementException):
+                pass
+
             self.logger.debug("No brand filter interface found")
             return False
             
         except Exception as e:
-            self.logger.debug(f"Brand filter error: {str(e)}")
+            self.logger.debug("Brand filter error: %s", str(e))
             return False
     
     def _select_brand_options(self):
@@ -789,73 +1445,55 @@ class ECommerceAnalyzer:
             for brand in target_brands:
                 brand_xpath = f"//label[contains(text(), '{brand}')]//input[@type='checkbox']"
                 try:
-                    checkbox = self.browser_manager.driver.find_element(By.XPATH, brand_xpath)
+                    checkbox = self._driver.find_element(By.XPATH, brand_xpath)
                     if not checkbox.is_selected():
                         checkbox.click()
                         time.sleep(1)
-                        self.logger.debug(f"Selected brand: {brand}")
+                        self.logger.debug("Selected brand: %s", brand)
                 except NoSuchElementException:
                     continue
                     
         except Exception as e:
-            self.logger.debug(f"Error selecting brands: {str(e)}")
+            self.logger.debug("Error selecting brands: %s", str(e))
     
     def _apply_rating_filter(self) -> bool:
         """Apply customer rating filter (4+ stars)"""
         try:
-            rating_selectors = [
-                # Best Buy specific rating selectors
-                ".sr-rating",
-                ".rating",
-                ".rating-stars",
-                "[data-testid='rating']",
-                ".stars",
-                ".c-rating",
-                ".sr-rating__score",
-                ".average-rating"
-            ]
-            
-            for selector in rating_selectors:
-                try:
-                    rating_element = element.find_element(By.CSS_SELECTOR, selector)
-                    rating_text = rating_element.text.strip()
-                    
+            # Misses are expected while probing fallbacks; zeroing the
+            # implicit wait keeps each one instant instead of blocking
+            # for the configured timeout
+            with self._no_implicit_wait():
+                for selector in _RATING_CSS:
+                    # find_elements avoids the exception raise/catch on misses
+                    rating_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                    if not rating_elements:
+                        continue
+                    rating_text = rating_elements[0].text.strip()
+
                     # Extract numeric rating
-                    import re
-                    rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+                    rating_match = _RE_FLOAT.search(rating_text)
                     if rating_match:
                         rating_value = float(rating_match.group(1))
                         # Ensure rating is within reasonable range (0-5)
                         if 0 <= rating_value <= 5:
                             return rating_value
-                        
-                except NoSuchElementException:
-                    continue
-            
-            # Try looking for aria-label or title attributes that might contain rating
-            xpath_selectors = [
-                ".//*[contains(@aria-label, 'star') or contains(@title, 'star')]",
-                ".//*[contains(@aria-label, 'rating') or contains(@title, 'rating')]",
-                ".//*[contains(@class, 'rating') or contains(@class, 'star')]"
-            ]
-            
-            for xpath in xpath_selectors:
-                try:
-                    rating_element = element.find_element(By.XPATH, xpath)
+
+                # Try looking for aria-label or title attributes that might contain rating
+                for xpath in _RATING_XPATHS:
+                    rating_elements = element.find_elements(By.XPATH, xpath)
+                    if not rating_elements:
+                        continue
                     # Check aria-label or title
                     for attr in ['aria-label', 'title']:
-                        attr_value = rating_element.get_attribute(attr)
+                        attr_value = rating_elements[0].get_attribute(attr)
                         if attr_value:
-                            import re
-                            rating_match = re.search(r'(\d+\.?\d*)', attr_value)
+                            rating_match = _RE_FLOAT.search(attr_value)
                             if rating_match:
                                 rating_value = float(rating_match.group(1))
                                 if 0 <= rating_value <= 5:
                                     return rating_value
-                except NoSuchElementException:
-                    continue
             
-            return None
+                return None
             
         except Exception:
             return None
@@ -863,73 +1501,66 @@ class ECommerceAnalyzer:
     def _extract_review_count(self, element) -> Optional[int]:
         """Extract number of reviews from element"""
         try:
-            # Use the specific selector provided by user: span with class "c-reviews"
-            try:
-                review_element = element.find_element(By.CSS_SELECTOR, "span.c-reviews")
-                review_text = review_element.text.strip()
-                
-                # Extract numeric count
-                import re
-                review_match = re.search(r'(\d+)', review_text.replace(',', ''))
-                if review_match:
-                    review_count = int(review_match.group(1))
-                    # Reasonable range check
-                    if review_count >= 0:
-                        return review_count
-            except NoSuchElementException:
-                self.logger.debug("span.c-reviews not found, trying alternative selectors")
-            
-            # Fallback selectors if the main one doesn't work
-            fallback_selectors = [
-                ".c-reviews",
-                ".review-count",
-                ".reviews-count",
-                "[data-testid='review-count']",
-                ".reviews",
-                ".number-of-reviews"
-            ]
-            
-            for selector in fallback_selectors:
-                try:
-                    review_element = element.find_element(By.CSS_SELECTOR, selector)
-                    review_text = review_element.text.strip()
-                    
+            # Misses are expected while probing fallbacks; zeroing the
+            # implicit wait keeps each one instant instead of blocking
+            # for the configured timeout
+            with self._no_implicit_wait():
+                # Use the specific selector provided by user: span with class "c-reviews"
+                review_elements = element.find_elements(By.CSS_SELECTOR, "span.c-reviews")
+                if review_elements:
+                    review_text = review_elements[0].text.strip()
+
                     # Extract numeric count
-                    import re
-                    review_match = re.search(r'(\d+)', review_text.replace(',', ''))
+                    review_match = _RE_INT.search(review_text.replace(',', ''))
                     if review_match:
                         review_count = int(review_match.group(1))
                         # Reasonable range check
                         if review_count >= 0:
                             return review_count
-                            
-                except NoSuchElementException:
-                    continue
-            
-            # Try XPath to look for review-related text with numbers
-            xpath_selectors = [
-                ".//*[contains(text(), 'review') and contains(text(), '(')]",
-                ".//*[contains(text(), 'Review') and contains(text(), '(')]",
-                ".//*[contains(@aria-label, 'review')]",
-                ".//*[contains(@title, 'review')]"
-            ]
-            
-            for xpath in xpath_selectors:
-                try:
-                    review_element = element.find_element(By.XPATH, xpath)
-                    review_text = review_element.text.strip()
-                    
-                    import re
+                else:
+                    self.logger.debug("span.c-reviews not found, trying alternative selectors")
+
+                # Try the selector that won on a previous card first
+                cached = self._winning_selector.get("reviews")
+                if cached:
+                    cached_elements = element.find_elements(By.CSS_SELECTOR, cached)
+                    if cached_elements:
+                        review_text = cached_elements[0].text.strip()
+                        review_match = _RE_INT.search(review_text.replace(',', ''))
+                        if review_match and int(review_match.group(1)) >= 0:
+                            return int(review_match.group(1))
+
+                # Fallback selectors if the main one doesn't work
+                for selector in _REVIEW_CSS_FALLBACKS:
+                    review_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                    if not review_elements:
+                        continue
+                    review_text = review_elements[0].text.strip()
+
+                    # Extract numeric count
+                    review_match = _RE_INT.search(review_text.replace(',', ''))
+                    if review_match:
+                        review_count = int(review_match.group(1))
+                        # Reasonable range check
+                        if review_count >= 0:
+                            self._winning_selector["reviews"] = selector
+                            return review_count
+
+                # Try XPath to look for review-related text with numbers
+                for xpath in _REVIEW_XPATH_FALLBACKS:
+                    review_elements = element.find_elements(By.XPATH, xpath)
+                    if not review_elements:
+                        continue
+                    review_text = review_elements[0].text.strip()
+
                     # Look for patterns like "(123)" or "123 reviews"
-                    review_match = re.search(r'\(?(\d+)\)?', review_text.replace(',', ''))
+                    review_match = _RE_PAREN_INT.search(review_text.replace(',', ''))
                     if review_match:
                         review_count = int(review_match.group(1))
                         if review_count >= 0:
                             return review_count
-                except NoSuchElementException:
-                    continue
             
-            return None
+                return None
             
         except Exception:
             return None
@@ -941,7 +1572,9 @@ class ECommerceAnalyzer:
             filtered_url = "https://www.bestbuy.com/site/searchpage.jsp?browsedCategory=pcmcat138500050001&cp=11&id=pcat17071&qp=currentprice_facet%3DPrice%7E500+to+1500%5Ebrand_facet%3DBrand%7EDell%5Ebrand_facet%3DBrand%7ELenovo%5Ebrand_facet%3DBrand%7EHP%5Ecustomerreviews_facet%3DCustomer+Rating%7E4+%26+Up&st=categoryid%24pcmcat138500050001"
             
             self.logger.info(f"Navigating to pre-filtered results URL...")
-            self.browser_manager.driver.get(filtered_url)
+            # New page, new grid: the cached per-field winners no longer apply
+            self._winning_selector.clear()
+            self._driver.get(filtered_url)
             
             # Wait for page to load
             time.sleep(5)
@@ -962,7 +1595,7 @@ class ECommerceAnalyzer:
         """Verify we're on a page with filtered laptop results"""
         try:
             # Check URL contains search parameters
-            current_url = self.browser_manager.driver.current_url
+            current_url = self._driver.current_url
             if "searchpage.jsp" in current_url and "browsedCategory" in current_url:
                 self.logger.info("✓ URL verification: On search results page")
                 
@@ -974,29 +1607,29 @@ class ECommerceAnalyzer:
                     self.logger.info(f"✓ Filter verification: {applied_filters} filters detected in URL")
                     return True
             
-            # Check for products on the page
-            product_indicators = [
-                ".list-item",
-                ".product-card", 
-                ".sku-item",
-                "[data-testid*='product']"
-            ]
-            
-            for selector in product_indicators:
-                try:
-                    products = self.browser_manager.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(products) >= 3:
-                        self.logger.info(f"✓ Product verification: Found {len(products)} products")
-                        return True
-                except Exception:
-                    continue
+            # Check for products on the page: one grouped querySelectorAll
+            # covers all four indicators in a single round trip
+            try:
+                product_count = self._driver.execute_script(
+                    "return document.querySelectorAll(arguments[0]).length",
+                    ".list-item, .product-card, .sku-item, [data-testid*='product']"
+                )
+                if product_count >= 3:
+                    self.logger.info(f"✓ Product verification: Found {product_count} products")
+                    return True
+            except Exception:
+                pass
             
-            # Check page content for filter-related text
+            # Check page content for filter-related text: count keywords in
+            # the browser so only an int crosses the wire, instead of
+            # shipping and lowercasing the multi-MB page_source in Python
             try:
-                page_source = self.browser_manager.driver.page_source.lower()
-                filter_keywords = ["dell", "hp", "lenovo", "$500", "$1500", "rating"]
-                keyword_count = sum(1 for keyword in filter_keywords if keyword in page_source)
-                
+                keyword_count = self._driver.execute_script(
+                    "const t = document.body.innerText.toLowerCase();"
+                    "return ['dell', 'hp', 'lenovo', '$500', '$1500', 'rating']"
+                    ".filter(k => t.includes(k)).length;"
+                )
+
                 if keyword_count >= 3:
                     self.logger.info(f"✓ Content verification: Found filter-related content")
                     return True
@@ -1023,24 +1656,34 @@ class ECommerceAnalyzer:
         try:
             if use_specific_url and specific_url:
                 self.logger.info(f"Navigating to specific URL: {specific_url}")
+                # New page, new grid: the cached per-field winners no
+                # longer apply
+                self._winning_selector.clear()
                 
                 # Set a longer page load timeout for Best Buy
-                self.browser_manager.driver.set_page_load_timeout(60)
+                self._driver.set_page_load_timeout(60)
                 
                 try:
-                    self.browser_manager.driver.get(specific_url)
+                    self._driver.get(specific_url)
                     self.logger.info("✓ Initial page load completed")
                 except Exception as e:
                     self.logger.warning(f"Page load timeout, but continuing: {str(e)}")
                 
-                # Wait longer for page to start loading
-                time.sleep(10)
-                
+                # Wait for the document to start rendering rather than a
+                # fixed pause
+                try:
+                    WebDriverWait(self._driver, 10).until(
+                        lambda d: d.execute_script("return document.readyState")
+                        in ("interactive", "complete")
+                    )
+                except TimeoutException:
+                    self.logger.info("Page still loading after 10s, continuing with element waits")
+
                 # Check if main-results div is already loaded (skip country selection if so)
                 self.logger.info("Checking if main-results div is already loaded...")
                 main_results_already_loaded = False
                 try:
-                    main_results_check = WebDriverWait(self.browser_manager.driver, 10).until(
+                    main_results_check = WebDriverWait(self._driver, 10).until(
                         EC.presence_of_element_located((By.ID, "main-results"))
                     )
                     if main_results_check:
@@ -1063,7 +1706,7 @@ class ECommerceAnalyzer:
                         
                         try:
                             # Look for United States element with longer wait
-                            us_element = WebDriverWait(self.browser_manager.driver, 15).until(
+                            us_element = WebDriverWait(self._driver, 15).until(
                                 EC.element_to_be_clickable((By.XPATH, "//h4[contains(text(), 'United States')]"))
                             )
                             
@@ -1074,15 +1717,21 @@ class ECommerceAnalyzer:
                                 self.browser_manager.take_screenshot("before_country_selection")
                                 
                                 # Scroll to element and click
-                                self.browser_manager.driver.execute_script("arguments[0].scrollIntoView(true);", us_element)
+                                self._driver.execute_script("arguments[0].scrollIntoView(true);", us_element)
                                 time.sleep(2)
                                 
                                 us_element.click()
                                 self.logger.info("✓ Clicked on 'United States'")
-                                
-                                # Wait for navigation to complete
-                                time.sleep(10)
-                                
+
+                                # The click navigates away: wait for the old
+                                # element to go stale instead of a fixed pause
+                                try:
+                                    WebDriverWait(self._driver, 20).until(
+                                        EC.staleness_of(us_element)
+                                    )
+                                except TimeoutException:
+                                    self.logger.info("Country selection page did not refresh within 20s")
+
                                 # Take screenshot after clicking
                                 self.browser_manager.take_screenshot("after_country_selection")
                                 
@@ -1100,26 +1749,32 @@ class ECommerceAnalyzer:
                 else:
                     self.logger.info("Skipped country selection - main-results already available")
                 
-                # Wait additional time for the main page to load after country selection (or if already loaded)
+                # Wait for the results container after country selection
+                # (or proceed immediately if already loaded)
                 if country_handled and not main_results_already_loaded:
                     self.logger.info("Waiting for main page to load after country selection...")
-                    time.sleep(15)
+                    try:
+                        WebDriverWait(self._driver, 20).until(
+                            EC.presence_of_element_located((By.ID, "main-results"))
+                        )
+                    except TimeoutException:
+                        self.logger.info("main-results not present yet, proceeding to product wait")
                 else:
                     self.logger.info("Page already loaded, proceeding to product extraction...")
-                    time.sleep(5)  # Shorter wait since page is already loaded
-            
+
             self.logger.info("Extracting product data from filtered results...")
-            
+
             products = []
-            
-            # Wait for products to load with longer timeout
+
+            # Wait for product cards rather than a fixed pause; the page is
+            # usually ready well before the old sleep ceiling
             self.logger.info("Waiting for products to load...")
-            time.sleep(5)
+            self._wait_for_product_count(min_count=1, timeout=10)
             
             # Look specifically in the main-results div as requested by user
             main_results_div = None
             try:
-                main_results_div = WebDriverWait(self.browser_manager.driver, 20).until(
+                main_results_div = WebDriverWait(self._driver, 20).until(
                     EC.presence_of_element_located((By.ID, "main-results"))
                 )
                 self.logger.info("✓ Found main-results div")
@@ -1128,28 +1783,47 @@ class ECommerceAnalyzer:
                 self.logger.info("Scrolling to trigger lazy loading of products...")
                 
                 # First scroll to the main-results div
-                self.browser_manager.driver.execute_script("arguments[0].scrollIntoView(true);", main_results_div)
+                self._driver.execute_script("arguments[0].scrollIntoView(true);", main_results_div)
                 time.sleep(2)
                 
-                # Perform multiple scrolls to trigger lazy loading
-                for i in range(5):  # Scroll down 5 times
-                    self.logger.debug(f"Scroll attempt {i+1}/5")
-                    
-                    # Scroll down by a reasonable amount
-                    self.browser_manager.driver.execute_script("window.scrollBy(0, 800);")
-                    time.sleep(1.5)  # Wait for content to load
-                    
-                    # Check if new products appeared using the specific selector
-                    current_products = main_results_div.find_elements(By.CSS_SELECTOR, ".product-list-item")
-                    self.logger.debug(f"After scroll {i+1}: Found {len(current_products)} product-list-item elements")
-                    
-                    # If we have a good number of products, we can break early
-                    if len(current_products) >= 10:
-                        self.logger.info(f"Found sufficient products ({len(current_products)}) after {i+1} scrolls")
-                        break
+                # Preferred path: one async script scrolls to the bottom and
+                # resolves when the product count stabilizes
+                scrolled = False
+                try:
+                    self._driver.set_script_timeout(12)
+                    final_count = self._driver.execute_async_script(
+                        _LAZY_SCROLL_JS, 8000, 500
+                    )
+                    self.logger.info(f"✓ Lazy-load scroll settled with {final_count} products")
+                    scrolled = True
+                except Exception as e:
+                    self.logger.debug("In-page scroll unavailable, falling back to scroll loop: %s", str(e))
+
+                if not scrolled:
+                    # Fallback: perform multiple scrolls to trigger lazy loading
+                    prev_count = len(
+                        main_results_div.find_elements(By.CSS_SELECTOR, ".product-list-item")
+                    )
+                    for i in range(5):  # Scroll down 5 times
+                        self.logger.debug("Scroll attempt %s/5", i+1)
+
+                        # Scroll down by a reasonable amount, then wait briefly
+                        # for the count to grow instead of a fixed pause
+                        self._driver.execute_script("window.scrollBy(0, 800);")
+                        self._wait_for_product_count(min_count=prev_count + 1, timeout=1.5)
+
+                        # Check if new products appeared using the specific selector
+                        current_products = main_results_div.find_elements(By.CSS_SELECTOR, ".product-list-item")
+                        prev_count = len(current_products)
+                        self.logger.debug("After scroll %s: Found %s product-list-item elements", i+1, len(current_products))
+
+                        # If we have a good number of products, we can break early
+                        if len(current_products) >= 10:
+                            self.logger.info(f"Found sufficient products ({len(current_products)}) after {i+1} scrolls")
+                            break
                 
                 # Scroll back to top of main-results for extraction
-                self.browser_manager.driver.execute_script("arguments[0].scrollIntoView(true);", main_results_div)
+                self._driver.execute_script("arguments[0].scrollIntoView(true);", main_results_div)
                 time.sleep(1)
                 
                 self.logger.info("✓ Completed scrolling to trigger lazy loading")
@@ -1160,19 +1834,36 @@ class ECommerceAnalyzer:
                 # Even if main-results not found, try scrolling the entire page
                 self.logger.info("Scrolling entire page to trigger lazy loading...")
                 for i in range(3):
-                    self.browser_manager.driver.execute_script("window.scrollBy(0, 1000);")
+                    self._driver.execute_script("window.scrollBy(0, 1000);")
                     time.sleep(2)
                 
                 # Take a screenshot for debugging
                 self.browser_manager.take_screenshot("main_results_not_found")
             
+            # One bulk script call maps the whole grid to raw dicts in a
+            # single wire round trip; a local page_source parse is the
+            # next-cheapest path when the script yields nothing
+            products = self._extract_products_via_script()
+            if not products:
+                products = self._extract_products_from_html()
+            if products:
+                self.logger.info(f"✓ Successfully extracted data for {len(products)} products")
+
+                # Save raw data
+                self._save_product_data(products)
+
+                # Log detailed sample for verification
+                self._log_samples(products)
+
+                return products
+
             # Find product containers within main-results or entire page
             product_selectors = [
                 ".product-list-item"
             ]
             
             product_elements = []
-            search_context = main_results_div if main_results_div else self.browser_manager.driver
+            search_context = main_results_div if main_results_div else self._driver
             
             for selector in product_selectors:
                 try:
@@ -1190,13 +1881,15 @@ class ECommerceAnalyzer:
             
             if not product_elements:
                 # Log current page details for debugging
-                current_url = self.browser_manager.driver.current_url
-                page_title = self.browser_manager.driver.title
+                current_url = self._driver.current_url
+                page_title = self._driver.title
                 self.logger.error(f"No products found. Current URL: {current_url}")
                 self.logger.error(f"Page title: {page_title}")
                 
-                # Take final screenshot for debugging
+                # Take final screenshot for debugging and persist the
+                # buffered ones now that extraction failed
                 self.browser_manager.take_screenshot("no_products_found_debug")
+                self.browser_manager.flush_screenshots_on_error()
                 return []
             
             # Extract data from each product
@@ -1207,7 +1900,7 @@ class ECommerceAnalyzer:
                         products.append(product_data)
                         
                 except Exception as e:
-                    self.logger.debug(f"Error extracting product {i}: {str(e)}")
+                    self.logger.debug("Error extracting product %s: %s", i, str(e))
                     continue
             
             self.logger.info(f"✓ Successfully extracted data for {len(products)} products")
@@ -1216,7 +1909,7 @@ class ECommerceAnalyzer:
             self._save_product_data(products)
             
             # Log detailed sample for verification
-            self._log_detailed_sample_products(products)
+            self._log_samples(products)
             
             return products
             
@@ -1225,32 +1918,110 @@ class ECommerceAnalyzer:
             # Take screenshot for debugging
             try:
                 self.browser_manager.take_screenshot("extraction_error_debug")
+                self.browser_manager.flush_screenshots_on_error()
             except:
                 pass
             return []
     
+    def _wait_for_product_count(self, min_count: int = 1, timeout: float = 10) -> bool:
+        """
+        Wait until at least min_count product cards are present
+
+        Args:
+            min_count: Number of .product-list-item elements to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if the count was reached before the timeout
+        """
+        try:
+            WebDriverWait(self._driver, timeout, poll_frequency=0.25).until(
+                lambda d: len(
+                    d.find_elements(By.CSS_SELECTOR, ".product-list-item")
+                ) >= min_count
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _extract_products_from_html(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Extract products by parsing the already-loaded page HTML locally
+
+        One page_source fetch replaces dozens of per-product WebDriver
+        round trips; the selector lookups run in-process on the static
+        tree, with Selenium kept only for navigation and scrolling.
+
+        Args:
+            limit: Maximum number of products to extract
+
+        Returns:
+            List of product dicts; empty when no product cards parse
+        """
+        try:
+            # Serialize only the results subtree: page_source ships the
+            # whole document (head, scripts, footer) over the wire when
+            # all we parse is the product grid
+            try:
+                html = self._driver.execute_script(
+                    "const el = document.getElementById('main-results');"
+                    "return el ? el.outerHTML : document.body.outerHTML;"
+                )
+            except Exception:
+                html = self._driver.page_source
+            soup = BeautifulSoup(html, "html.parser")
+            cards = (soup.select("#main-results .product-list-item")
+                     or soup.select(".product-list-item"))
+            products = []
+            for i, card in enumerate(cards[:limit]):
+                name_el = card.select_one("h2.product-title")
+                price_el = card.select_one("div.customer-price")
+                rating_el = card.select_one(".sr-rating")
+                reviews_el = card.select_one("span.c-reviews")
+                link_el = (card.select_one("a[href*='/site/']")
+                           or card.select_one("a"))
+                product_data = {
+                    "index": i,
+                    "name": self._clean_product_name(
+                        name_el.get_text(strip=True) if name_el else None),
+                    "price": self._clean_product_price(
+                        price_el.get_text(strip=True) if price_el else None),
+                    "rating": self._clean_product_rating(
+                        rating_el.get_text(strip=True) if rating_el else None),
+                    "review_count": self._clean_review_count(
+                        reviews_el.get_text(strip=True) if reviews_el else None),
+                    "url": self._clean_product_url(
+                        link_el.get("href") if link_el else None),
+                    "specifications": self._specs_from_text(
+                        card.get_text(" ", strip=True))
+                }
+                # Only keep cards that parsed at least name and price
+                if product_data["name"] and product_data["price"]:
+                    products.append(product_data)
+            return products
+
+        except Exception as e:
+            self.logger.debug("Local HTML extraction failed: %s", str(e))
+            return []
+
     def _find_products_alternative(self, search_context) -> List:
         """Alternative method to find product elements"""
         try:
-            # Try different approaches
-            alternative_selectors = [
-                "//div[contains(@class, 'product')]",
-                "//div[contains(@class, 'item')]",
-                "//article",
-                "//div[contains(@class, 'card')]",
-                "//*[contains(@class, 'sku')]"
-            ]
-            
-            for selector in alternative_selectors:
-                try:
-                    elements = search_context.find_elements(By.XPATH, selector)
-                    if len(elements) > 5:  # Reasonable number of products
-                        self.logger.info(f"Alternative method found {len(elements)} elements")
-                        return elements
-                except Exception:
-                    continue
+            # Misses are expected while probing fallbacks; zeroing the
+            # implicit wait keeps each one instant instead of blocking
+            # for the configured timeout
+            with self._no_implicit_wait():
+                # Try different approaches
+                for selector in _ALT_PRODUCT_CSS:
+                    try:
+                        elements = search_context.find_elements(By.CSS_SELECTOR, selector)
+                        if len(elements) > 5:  # Reasonable number of products
+                            self.logger.info(f"Alternative method found {len(elements)} elements")
+                            return elements
+                    except Exception:
+                        continue
             
-            return []
+                return []
             
         except Exception:
             return []
@@ -1267,58 +2038,231 @@ class ECommerceAnalyzer:
             Dict containing product data or None if extraction fails
         """
         try:
-            product_data = {
-                "index": index,
-                "name": self._extract_product_name(element),
-                "price": self._extract_product_price(element),
-                "rating": self._extract_product_rating(element),
-                "review_count": self._extract_review_count(element),
-                "url": self._extract_product_url(element),
-                "specifications": self._extract_basic_specs(element)
-            }
-            
+            # Preferred path: fetch every field in one script call and
+            # clean the returned strings locally with the compiled regexes
+            raw = None
+            try:
+                raw = self._driver.execute_script(_PRODUCT_FIELDS_JS, element)
+            except Exception as e:
+                self.logger.debug("Fused field extraction unavailable: %s", str(e))
+
+            if raw is not None:
+                product_data = self._product_from_raw(raw, index)
+            else:
+                # Fallback: per-field WebDriver probes
+                product_data = {
+                    "index": index,
+                    "name": self._extract_product_name(element),
+                    "price": self._extract_product_price(element),
+                    "rating": self._extract_product_rating(element),
+                    "review_count": self._extract_review_count(element),
+                    "url": self._extract_product_url(element),
+                    "specifications": self._extract_basic_specs(element)
+                }
+
             # Only return if we have at least name and price
             if product_data["name"] and product_data["price"]:
-                self.logger.debug(f"Extracted product {index}: {product_data['name']}")
+                self.logger.debug("Extracted product %s: %s", index, product_data['name'])
                 return product_data
             else:
                 return None
-                
+
         except Exception as e:
-            self.logger.debug(f"Error extracting product {index}: {str(e)}")
+            self.logger.debug("Error extracting product %s: %s", index, str(e))
             return None
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Temporarily zero the implicit wait while probing fallback selectors
+
+        With the configured implicit wait, every find_elements miss blocks
+        for the full timeout before returning empty — turning a handful of
+        fallback probes into many seconds of dead time per product.
+        """
+        driver = self._driver
+        try:
+            previous = driver.timeouts.implicit_wait
+        except Exception:
+            previous = config.WAIT_CONFIG["implicit_wait"]
+        driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            driver.implicitly_wait(previous)
+
+    def _product_from_raw(self, raw: Dict[str, Any], index: int) -> Dict[str, Any]:
+        """Clean a raw browser-side field dict into a product record"""
+        return {
+            "index": index,
+            "name": self._clean_product_name(raw.get("name")),
+            "price": self._clean_product_price(raw.get("price")),
+            "rating": self._clean_product_rating(raw.get("rating")),
+            "review_count": self._clean_review_count(raw.get("reviews")),
+            "url": self._clean_product_url(raw.get("url")),
+            "specifications": self._specs_from_text(raw.get("text") or "")
+        }
+
+    def _extract_products_via_script(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Extract every product card's fields in a single script call
+
+        The browser maps the whole grid to raw field dicts in one wire
+        round trip; all cleanup then runs locally with no further
+        WebDriver calls.
+
+        Args:
+            limit: Maximum number of products to extract
+
+        Returns:
+            List of product dicts; empty when the script yields nothing
+        """
+        raw_products = None
+        try:
+            # Prefer the CDP channel: Runtime.evaluate with returnByValue
+            # answers in a single devtools message
+            result = self._driver.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {"expression": _BULK_PRODUCTS_CDP_JS % limit, "returnByValue": True},
+            )
+            value = result.get("result", {}).get("value")
+            if value:
+                raw_products = json.loads(value)
+        except Exception as e:
+            self.logger.debug("CDP bulk extraction unavailable: %s", str(e))
+
+        if raw_products is None:
+            try:
+                raw_products = self._driver.execute_script(_BULK_PRODUCTS_JS, limit)
+            except Exception as e:
+                self.logger.debug("Bulk product extraction unavailable: %s", str(e))
+                return []
+
+        products = []
+        for raw in raw_products or []:
+            product_data = self._product_from_raw(raw, raw.get("index", len(products)))
+            # Only keep cards that yielded at least name and price
+            if product_data["name"] and product_data["price"]:
+                products.append(product_data)
+        return products
+
+    @staticmethod
+    def _clean_product_name(text: Optional[str]) -> Optional[str]:
+        """Validate a raw name string using the extractor's length rule"""
+        if text and len(text) > 5:  # Reasonable product name length
+            return text
+        return None
+
+    @staticmethod
+    def _clean_product_price(text: Optional[str]) -> Optional[str]:
+        """Normalize a raw price string to the $X,XXX.XX form"""
+        if text:
+            # Prices always start at the dollar sign, so locate it with
+            # str.find and match anchored there instead of letting the
+            # regex scan the prefix
+            i = text.find("$")
+            if i >= 0:
+                price_match = _RE_PRICE.match(text, i)
+                if price_match:
+                    return price_match.group(0)
+                return text
+        return None
+
+    @staticmethod
+    def _clean_product_rating(text: Optional[str]) -> Optional[float]:
+        """Parse a numeric rating in the 0-5 range from raw text"""
+        if text:
+            rating_match = _RE_FLOAT.search(text)
+            if rating_match:
+                rating_value = float(rating_match.group(1))
+                if 0 <= rating_value <= 5:
+                    return rating_value
+        return None
+
+    @staticmethod
+    def _clean_review_count(text: Optional[str]) -> Optional[int]:
+        """Parse a non-negative review count from raw text"""
+        if text:
+            review_match = _RE_INT.search(text.replace(',', ''))
+            if review_match:
+                review_count = int(review_match.group(1))
+                if review_count >= 0:
+                    return review_count
+        return None
+
+    @staticmethod
+    def _clean_product_url(url: Optional[str]) -> Optional[str]:
+        """Keep only product-detail URLs (Best Buy /site/ links)"""
+        if url and "/site/" in url:
+            return url
+        return None
+
+    def _specs_from_text(self, all_text: str) -> Dict[str, Any]:
+        """Derive specification details and terms from already-fetched product text"""
+        specs = {}
+        try:
+            if all_text and len(all_text) > 20:
+                # One scan collects both the key-term list and the
+                # per-category detail fields
+                spec_details = {}
+                key_terms = []
+                detail_keys = {"cpu": "processor", "ram": "memory", "storage": "storage"}
+                # The anchored screen pattern decides on its own; no
+                # re-matching of the fused regex's screen spans needed
+                size_match = _RE_SCREEN_INCH.search(all_text)
+                if size_match:
+                    spec_details["screen_size"] = f"{size_match.group(1)} inches"
+                for match in _SPECS_RE.finditer(all_text):
+                    group = match.lastgroup
+                    key_terms.append(match.group(group))
+                    key = detail_keys.get(group)
+                    if key and key not in spec_details:
+                        spec_details[key] = match.group()[:100]  # Limit length
+
+                if spec_details:
+                    specs["details"] = spec_details
+                if key_terms:
+                    specs["extracted_terms"] = key_terms[:10]  # Limit to 10 terms
+        except Exception:
+            pass
+        return specs
     
     def _extract_product_name(self, element) -> Optional[str]:
         """Extract product name from element"""
         try:
-            # Use the specific selector provided by user: h2 with class "product-title"
-            try:
-                name_element = element.find_element(By.CSS_SELECTOR, "h2.product-title")
-                name = name_element.text.strip()
-                if name and len(name) > 5:  # Reasonable product name length
-                    return name
-            except NoSuchElementException:
-                self.logger.debug("h2.product-title not found, trying alternative selectors")
-            
-            # Fallback selectors if the main one doesn't work
-            fallback_selectors = [
-                ".product-title",
-                "h2",
-                "h3", 
-                "h4",
-                "[data-testid='product-title']"
-            ]
-            
-            for selector in fallback_selectors:
-                try:
-                    name_element = element.find_element(By.CSS_SELECTOR, selector)
-                    name = name_element.text.strip()
+            # Misses are expected while probing fallbacks; zeroing the
+            # implicit wait keeps each one instant instead of blocking
+            # for the configured timeout
+            with self._no_implicit_wait():
+                # Use the specific selector provided by user: h2 with class "product-title"
+                name_elements = element.find_elements(By.CSS_SELECTOR, "h2.product-title")
+                if name_elements:
+                    name = name_elements[0].text.strip()
                     if name and len(name) > 5:  # Reasonable product name length
                         return name
-                except NoSuchElementException:
-                    continue
+                else:
+                    self.logger.debug("h2.product-title not found, trying alternative selectors")
+
+                # Try the selector that won on a previous card first
+                cached = self._winning_selector.get("name")
+                if cached:
+                    cached_elements = element.find_elements(By.CSS_SELECTOR, cached)
+                    if cached_elements:
+                        name = cached_elements[0].text.strip()
+                        if name and len(name) > 5:
+                            return name
+
+                # Fallback selectors if the main one doesn't work
+                for selector in _NAME_CSS_FALLBACKS:
+                    name_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                    if not name_elements:
+                        continue
+                    name = name_elements[0].text.strip()
+                    if name and len(name) > 5:  # Reasonable product name length
+                        self._winning_selector["name"] = selector
+                        return name
             
-            return None
+                return None
             
         except Exception:
             return None
@@ -1326,44 +2270,39 @@ class ECommerceAnalyzer:
     def _extract_product_price(self, element) -> Optional[str]:
         """Extract product price from element"""
         try:
-            # Use the specific selector provided by user: div with class "customer-price" (inner text)
-            try:
-                price_element = element.find_element(By.CSS_SELECTOR, "div.customer-price")
-                price = price_element.text.strip()
-                if price and "$" in price:
-                    # Clean up price text
-                    import re
-                    price_match = re.search(r'\$[\d,]+\.?\d*', price)
-                    if price_match:
-                        return price_match.group(0)
-                    return price
-            except NoSuchElementException:
-                self.logger.debug("div.customer-price not found, trying alternative selectors")
-            
-            # Fallback selectors if the main one doesn't work
-            fallback_selectors = [
-                ".customer-price",
-                ".price",
-                ".current-price",
-                ".pricing-current-price",
-                "[data-testid='price']"
-            ]
-            
-            for selector in fallback_selectors:
-                try:
-                    price_element = element.find_element(By.CSS_SELECTOR, selector)
-                    price = price_element.text.strip()
-                    if price and "$" in price:
-                        # Clean up price text
-                        import re
-                        price_match = re.search(r'\$[\d,]+\.?\d*', price)
-                        if price_match:
-                            return price_match.group(0)
+            # Misses are expected while probing fallbacks; zeroing the
+            # implicit wait keeps each one instant instead of blocking
+            # for the configured timeout
+            with self._no_implicit_wait():
+                # Use the specific selector provided by user: div with class "customer-price" (inner text)
+                price_elements = element.find_elements(By.CSS_SELECTOR, "div.customer-price")
+                if price_elements:
+                    price = self._clean_product_price(price_elements[0].text.strip())
+                    if price:
+                        return price
+                else:
+                    self.logger.debug("div.customer-price not found, trying alternative selectors")
+
+                # Try the selector that won on a previous card first
+                cached = self._winning_selector.get("price")
+                if cached:
+                    cached_elements = element.find_elements(By.CSS_SELECTOR, cached)
+                    if cached_elements:
+                        price = self._clean_product_price(cached_elements[0].text.strip())
+                        if price:
+                            return price
+
+                # Fallback selectors if the main one doesn't work
+                for selector in _PRICE_CSS_FALLBACKS:
+                    price_elements = element.find_elements(By.CSS_SELECTOR, selector)
+                    if not price_elements:
+                        continue
+                    price = self._clean_product_price(price_elements[0].text.strip())
+                    if price:
+                        self._winning_selector["price"] = selector
                         return price
-                except NoSuchElementException:
-                    continue
             
-            return None
+                return None
             
         except Exception:
             return None
@@ -1371,217 +2310,115 @@ class ECommerceAnalyzer:
     def _extract_product_url(self, element) -> Optional[str]:
         """Extract product URL from element"""
         try:
-            link_selectors = [
-                "a[href*='/site/']",
-                ".sr-title a",
-                ".product-title a",
-                "h3 a",
-                "h4 a"
-            ]
-            
-            for selector in link_selectors:
-                try:
-                    link_element = element.find_element(By.CSS_SELECTOR, selector)
+            # Zero the implicit wait: tiles without links are routine, and
+            # an empty find_elements result must come back instantly
+            # instead of stalling for the configured timeout
+            with self._no_implicit_wait():
+                # One grouped query instead of up to five sequential
+                # find_element round-trips to the browser
+                link_elements = element.find_elements(
+                    By.CSS_SELECTOR,
+                    "a[href*='/site/'], .sr-title a, .product-title a, h3 a, h4 a"
+                )
+                for link_element in link_elements:
                     url = link_element.get_attribute("href")
                     if url and "/site/" in url:
                         return url
-                except NoSuchElementException:
-                    continue
-            
-            return None
-            
-        except Exception:
+
+                return None
+
+        except (NoSuchElementException, StaleElementReferenceException):
+            # Missing/recycled tiles are routine during lazy-load; anything
+            # else is a programming error and should surface
             return None
     
     def _extract_basic_specs(self, element) -> Dict[str, Any]:
         """Extract basic specifications from element if available"""
         try:
-            specs = {}
-            
-            # Look for specification text in various formats
-            spec_selectors = [
-                # Best Buy specific specification selectors
-                ".sr-spec",
-                ".specifications",
-                ".product-specs",
-                ".features",
-                ".key-specs",
-                ".sr-item-specifications",
-                ".item-features",
-                ".product-features",
-                ".sr-product-highlights",
-                ".highlight-list"
-            ]
-            
-            for selector in spec_selectors:
-                try:
-                    spec_element = element.find_element(By.CSS_SELECTOR, selector)
-                    spec_text = spec_element.text.strip()
-                    if spec_text and len(spec_text) > 10:
-                        specs["basic_info"] = spec_text
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Look for specific common laptop specifications
-            spec_details = {}
-            
-            # Try to extract specific details from the product element
-            try:
-                # Look for processor information
-                processor_keywords = ["Intel", "AMD", "i3", "i5", "i7", "i9", "Ryzen", "Core"]
-                processor_selectors = [
-                    ".//*[contains(text(), 'Intel') or contains(text(), 'AMD') or contains(text(), 'Core') or contains(text(), 'Ryzen')]"
-                ]
-                
-                for xpath in processor_selectors:
-                    try:
-                        proc_elements = element.find_elements(By.XPATH, xpath)
-                        for proc_element in proc_elements:
-                            proc_text = proc_element.text.strip()
-                            if any(keyword in proc_text for keyword in processor_keywords):
-                                spec_details["processor"] = proc_text[:100]  # Limit length
-                                break
-                        if "processor" in spec_details:
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Look for RAM information
-            try:
-                ram_selectors = [
-                    ".//*[contains(text(), 'GB') and (contains(text(), 'RAM') or contains(text(), 'Memory'))]",
-                    ".//*[contains(text(), 'GB') and contains(text(), 'DDR')]"
-                ]
-                
-                for xpath in ram_selectors:
-                    try:
-                        ram_elements = element.find_elements(By.XPATH, xpath)
-                        for ram_element in ram_elements:
-                            ram_text = ram_element.text.strip()
-                            if "GB" in ram_text and len(ram_text) < 50:
-                                spec_details["memory"] = ram_text
-                                break
-                        if "memory" in spec_details:
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Look for storage information
-            try:
-                storage_selectors = [
-                    ".//*[contains(text(), 'SSD') or contains(text(), 'HDD') or contains(text(), 'TB') or contains(text(), 'Storage')]"
-                ]
-                
-                for xpath in storage_selectors:
-                    try:
-                        storage_elements = element.find_elements(By.XPATH, xpath)
-                        for storage_element in storage_elements:
-                            storage_text = storage_element.text.strip()
-                            if any(keyword in storage_text for keyword in ["SSD", "HDD", "TB", "GB"]) and len(storage_text) < 50:
-                                spec_details["storage"] = storage_text
-                                break
-                        if "storage" in spec_details:
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Look for screen size
-            try:
-                screen_selectors = [
-                    ".//*[contains(text(), 'inch') or contains(text(), '\"')]"
-                ]
-                
-                for xpath in screen_selectors:
-                    try:
-                        screen_elements = element.find_elements(By.XPATH, xpath)
-                        for screen_element in screen_elements:
-                            screen_text = screen_element.text.strip()
-                            if ("inch" in screen_text or '"' in screen_text) and len(screen_text) < 30:
-                                import re
-                                # Look for screen size pattern like "15.6 inch" or '15.6"'
-                                size_match = re.search(r'(\d+\.?\d*)\s*(?:inch|")', screen_text)
-                                if size_match:
-                                    spec_details["screen_size"] = f"{size_match.group(1)} inches"
-                                    break
-                        if "screen_size" in spec_details:
-                            break
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Add specific details to specs if found
-            if spec_details:
-                specs["details"] = spec_details
-            
-            # Try to get additional product information from any visible text
-            try:
-                all_text = element.text.strip()
-                if all_text and len(all_text) > 20:
-                    # Extract key terms that might be specifications
-                    import re
-                    key_terms = []
-                    
-                    # Look for common laptop terms
-                    patterns = [
-                        r'(\d+\.?\d*\s*(?:inch|"))',  # Screen size
-                        r'(\d+\s*GB\s*(?:RAM|Memory|DDR\d?))',  # RAM
-                        r'(\d+\s*(?:GB|TB)\s*(?:SSD|HDD|Storage))',  # Storage
-                        r'(Intel\s+Core\s+i\d+|AMD\s+Ryzen\s+\d+)',  # Processor
-                        r'(Windows\s+\d+|macOS|Chrome\s*OS)',  # OS
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = re.findall(pattern, all_text, re.IGNORECASE)
-                        key_terms.extend(matches)
-                    
-                    if key_terms:
-                        specs["extracted_terms"] = key_terms[:10]  # Limit to 10 terms
-            except:
-                pass
-            
+            # The rendered tile text is fetched exactly once — each .text
+            # access serializes the whole subtree across the WebDriver
+            # bridge — and every spec pass parses the cached string locally
+            all_text = (element.text or "").strip()
+            # Half-rendered lazy-load tiles come back with little or no
+            # text; skip the selector probe and regex passes outright
+            # (same threshold _specs_from_text applies)
+            if len(all_text) < 20:
+                return {}
+            specs = self._specs_from_text(all_text)
+
+            # Look for specification text in various formats; the Best Buy
+            # specific selectors are grouped into one query rather than ten
+            # sequential find_element round-trips.  Most tiles carry no
+            # spec block at all, so the implicit wait is zeroed to keep the
+            # empty result instant
+            with self._no_implicit_wait():
+                spec_elements = element.find_elements(
+                    By.CSS_SELECTOR,
+                    ".sr-spec, .specifications, .product-specs, .features, "
+                    ".key-specs, .sr-item-specifications, .item-features, "
+                    ".product-features, .sr-product-highlights, .highlight-list"
+                )
+            for spec_element in spec_elements:
+                spec_text = spec_element.text.strip()
+                if spec_text and len(spec_text) > 10:
+                    specs["basic_info"] = spec_text
+                    break
+
             return specs
-            
-        except Exception:
+
+        except (NoSuchElementException, StaleElementReferenceException):
             return {}
     
     def _save_product_data(self, products: List[Dict[str, Any]]):
         """Save extracted product data to JSON file"""
         try:
-            # Ensure data directory exists
-            config.DATA_DIR.mkdir(exist_ok=True)
-            
-            # Save to JSON file
-            json_file = config.DATA_DIR / config.OUTPUT_CONFIG["json_filename"]
-            
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(products, f, indent=2, ensure_ascii=False)
-            
-            self.logger.info(f"✓ Product data saved to {json_file}")
+            # Directory creation and path join happen once in __init__
+            if config.OUTPUT_CONFIG.get("ndjson"):
+                # One record per line: no whole-list string buffer, and the
+                # file stays tail-readable during long extractions
+                with open(self._json_path, 'wb') as f:
+                    for product in products:
+                        if orjson is not None:
+                            f.write(orjson.dumps(product))
+                        else:
+                            f.write(json.dumps(product, ensure_ascii=False).encode("utf-8"))
+                        f.write(b'\n')
+            elif orjson is not None:
+                with open(self._json_path, 'wb') as f:
+                    f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self._json_path, 'w', encoding='utf-8') as f:
+                    json.dump(products, f, indent=2, ensure_ascii=False)
+
+            self.logger.info(f"✓ Product data saved to {self._json_path}")
             
         except Exception as e:
             self.logger.error(f"Error saving product data: {str(e)}")
     
-    def _log_detailed_sample_products(self, products: List[Dict[str, Any]]):
-        """Log detailed sample product information for verification"""
+    @staticmethod
+    def _trunc(text: str, limit: int = 50) -> str:
+        """Truncate display text, appending an ellipsis only when cut"""
+        return text if len(text) <= limit else text[:limit] + '...'
+
+    def _log_samples(self, products: List[Dict[str, Any]], n: int = 3):
+        """Log sample product information for verification
+
+        Returns immediately when INFO logging is suppressed so the
+        per-product slicing and f-string work is skipped entirely.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         try:
-            self.logger.info("Detailed sample extracted products:")
-            for i, product in enumerate(products[:3]):  # Log first 3 products
+            self.logger.info("Sample extracted products:")
+            for i, product in enumerate(products[:n]):
                 name = product.get('name', 'N/A')
                 price = product.get('price', 'N/A')
                 rating = product.get('rating', 'N/A')
-                self.logger.info(f"  {i+1}. {name[:50]}{'...' if len(name) > 50 else ''}")
+                self.logger.info(f"  {i+1}. {self._trunc(name)}")
                 self.logger.info(f"      Price: {price}, Rating: {rating}")
-                
+
         except Exception as e:
-            self.logger.debug(f"Error logging detailed sample products: {str(e)}")
+            self.logger.debug("Error logging sample products: %s", str(e))
     
     def run_product_category_analysis(self) -> bool:
         """
@@ -1618,7 +2455,7 @@ class ECommerceAnalyzer:
                 self.logger.info(f"✓ Extracted data for {len(products)} products")
                 
                 # Log some sample product information
-                self._log_sample_products(products)
+                self._log_samples(products)
                 
                 self.logger.info("=" * 60)
                 return True
@@ -1630,20 +2467,6 @@ class ECommerceAnalyzer:
             self.logger.error(f"Product Category Analysis error: {str(e)}")
             return False
     
-    def _log_sample_products(self, products: List[Dict[str, Any]]):
-        """Log some sample product information for verification"""
-        try:
-            self.logger.info("Sample extracted products:")
-            for i, product in enumerate(products[:3]):  # Log first 3 products
-                name = product.get('name', 'N/A')
-                price = product.get('price', 'N/A')
-                rating = product.get('rating', 'N/A')
-                self.logger.info(f"  {i+1}. {name[:50]}{'...' if len(name) > 50 else ''}")
-                self.logger.info(f"      Price: {price}, Rating: {rating}")
-                
-        except Exception as e:
-            self.logger.debug(f"Error logging sample products: {str(e)}")
-    
     def run_initial_setup_demo(self) -> bool:
         """
         Run the complete initial setup and navigation demonstration
@@ -1662,8 +2485,10 @@ class ECommerceAnalyzer:
             if not self.navigate_to_target_website():
                 return False
             
-            # Step 3: Demonstrate wait strategies
-            if not self.demonstrate_wait_strategies():
+            # Step 3: Demonstrate wait strategies (skipped in fast mode)
+            if self.fast:
+                self.logger.info("Fast mode: skipping wait strategies demonstration")
+            elif not self.demonstrate_wait_strategies():
                 return False
             
             self.logger.info("🎉 Initial Setup and Navigation Demo completed successfully!")
@@ -1674,19 +2499,36 @@ class ECommerceAnalyzer:
         except Exception as e:
             self.logger.error(f"Demo execution error: {str(e)}")
             return False
-        finally:
-            # Always clean up
-            self.cleanup()
     
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources (safe to call more than once)"""
+        if self._cleaned:
+            return
+        self._cleaned = True
         try:
+            # Push any buffered log records to disk before shutting down
+            for handler in self.logger.handlers:
+                if isinstance(handler, MemoryHandler):
+                    handler.flush()
+            # Wait for in-flight screenshots before the driver goes away
+            self._io_pool.shutdown(wait=True)
             if self.browser_manager:
                 self.browser_manager.close()
                 self.logger.info("✓ Browser cleanup completed")
         except Exception as e:
             self.logger.error(f"Cleanup error: {str(e)}")
 
+    def __enter__(self):
+        """Context manager entry - guarantees an initialized browser"""
+        if not self.initialize_browser():
+            raise RuntimeError("Browser initialization failed")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensure cleanup"""
+        self.cleanup()
+        return False
+
     def extract_products_from_specific_url(self, url: str) -> List[Dict[str, Any]]:
         """
         Extract product data directly from a specific URL
@@ -1701,8 +2543,8 @@ class ECommerceAnalyzer:
             self.logger.info("🚀 Starting Product Extraction from Specific URL")
             self.logger.info(f"Target URL: {url}")
             
-            # Initialize browser if not already done
-            if not self.browser_manager or not self.browser_manager.driver:
+            # Launch the browser if not already done
+            if not self._driver:
                 if not self.initialize_browser():
                     self.logger.error("Failed to initialize browser")
                     return []
@@ -1717,7 +2559,7 @@ class ECommerceAnalyzer:
                 # Print a summary to console
                 print(f"\n✅ Extraction Complete!")
                 print(f"📊 Total products extracted: {len(products)}")
-                print(f"📁 Data saved to: {config.DATA_DIR / config.OUTPUT_CONFIG['json_filename']}")
+                print(f"📁 Data saved to: {self._json_path}")
                 print(f"📋 Log files saved to: {config.LOGS_DIR}")
                 
                 # Print sample products
@@ -1727,7 +2569,7 @@ class ECommerceAnalyzer:
                     price = product.get('price', 'N/A')
                     rating = product.get('rating', 'N/A')
                     reviews = product.get('review_count', 'N/A')
-                    print(f"  {i+1}. {name[:60]}{'...' if len(name) > 60 else ''}")
+                    print(f"  {i+1}. {self._trunc(name, 60)}")
                     print(f"      💰 Price: {price} | ⭐ Rating: {rating} | 📝 Reviews: {reviews}")
                 
                 return products
@@ -1739,134 +2581,137 @@ class ECommerceAnalyzer:
             self.logger.error(f"Error in extract_products_from_specific_url: {str(e)}")
             return []
 
+# Pre-filtered Best Buy laptops URL used when --extract-url is given with
+# no argument; hoisted so the long literal is built once at import time
+_DEFAULT_EXTRACT_URL = (
+    "https://www.bestbuy.com/site/searchpage.jsp?browsedCategory=pcmcat138500050001"
+    "&id=pcat17071&qp=currentprice_facet%3DPrice%7E500+to+1500"
+    "%5Ebrand_facet%3DBrand%7EDell%5Ebrand_facet%3DBrand%7ELenovo"
+    "%5Ebrand_facet%3DBrand%7EHP"
+    "%5Ecustomerreviews_facet%3DCustomer+Rating%7E4+%26+Up"
+    "&st=categoryid%24pcmcat138500050001"
+)
+
+def _parse_args(argv=None):
+    """Parse command line arguments in a single scan"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--visible", action="store_true")
+    parser.add_argument("--fast", action="store_true")
+    parser.add_argument("--task2", action="store_true")
+    parser.add_argument("--both", action="store_true")
+    parser.add_argument(
+        "--extract-url", dest="extract_url", nargs="?",
+        const=_DEFAULT_EXTRACT_URL,
+        default=None
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 def main():
     """Main function to run the e-commerce analytics automation"""
-    # Check command line arguments
-    headless_mode = True
-    run_task = "1"  # Default to Task 1
-    specific_url = None
-    
-    if len(sys.argv) > 1:
-        if "--visible" in sys.argv:
-            headless_mode = False
-            print("Running in visible mode for debugging...")
-        
-        if "--task2" in sys.argv:
-            run_task = "2"
-        elif "--both" in sys.argv:
-            run_task = "both"
-        elif "--extract-url" in sys.argv:
-            run_task = "extract-url"
-            # Look for the URL argument after --extract-url
-            try:
-                url_index = sys.argv.index("--extract-url") + 1
-                # Check if the next argument exists and is not another flag
-                if url_index < len(sys.argv) and not sys.argv[url_index].startswith("--"):
-                    specific_url = sys.argv[url_index]
-                else:
-                    # Use the default URL provided by user
-                    specific_url = "https://www.bestbuy.com/site/searchpage.jsp?browsedCategory=pcmcat138500050001&id=pcat17071&qp=currentprice_facet%3DPrice%7E500+to+1500%5Ebrand_facet%3DBrand%7EDell%5Ebrand_facet%3DBrand%7ELenovo%5Ebrand_facet%3DBrand%7EHP%5Ecustomerreviews_facet%3DCustomer+Rating%7E4+%26+Up&st=categoryid%24pcmcat138500050001"
-            except (ValueError, IndexError):
-                specific_url = "https://www.bestbuy.com/site/searchpage.jsp?browsedCategory=pcmcat138500050001&id=pcat17071&qp=currentprice_facet%3DPrice%7E500+to+1500%5Ebrand_facet%3DBrand%7EDell%5Ebrand_facet%3DBrand%7ELenovo%5Ebrand_facet%3DBrand%7EHP%5Ecustomerreviews_facet%3DCustomer+Rating%7E4+%26+Up&st=categoryid%24pcmcat138500050001"
-    
-    # Create and run the analyzer
-    analyzer = ECommerceAnalyzer(headless=headless_mode)
-    
+    args = _parse_args()
+
+    headless_mode = not args.visible
+    if args.visible:
+        print("Running in visible mode for debugging...")
+
+    specific_url = args.extract_url
+    if args.task2:
+        run_task = "2"
+    elif args.both:
+        run_task = "both"
+    elif specific_url is not None:
+        run_task = "extract-url"
+    else:
+        run_task = "1"  # Default to Task 1
+
+    # The context manager owns the driver lifetime: the browser comes up
+    # once on entry and the idempotent cleanup() runs exactly once on exit
     try:
-        if run_task == "extract-url":
-            print("🚀 Running Product Extraction from Specific URL")
-            print(f"URL: {specific_url}")
-            
-            products = analyzer.extract_products_from_specific_url(specific_url)
-            if products:
-                print(f"\n✅ Extraction completed successfully!")
-                print(f"Extracted {len(products)} products from the main-results div.")
-                return 0
-            else:
-                print("\n❌ Extraction failed!")
-                return 1
-                
-        elif run_task == "1":
-            print("🚀 Running Task 1: Initial Setup and Navigation")
-            success = analyzer.run_initial_setup_demo()
-            if success:
-                print("\n✅ Task 1 completed successfully!")
-                print("Check the logs directory for detailed execution logs.")
-                return 0
-            else:
-                print("\n❌ Task 1 failed!")
-                return 1
-                
-        elif run_task == "2":
-            print("🚀 Running Task 2: Product Category Analysis")
-            
-            # Initialize browser first
-            if not analyzer.initialize_browser():
-                print("\n❌ Browser initialization failed!")
-                return 1
-            
-            # Navigate to website
-            if not analyzer.navigate_to_target_website():
-                print("\n❌ Website navigation failed!")
-                return 1
-            
-            # Run Task 2
-            success = analyzer.run_product_category_analysis()
-            if success:
-                print("\n✅ Task 2 completed successfully!")
-                print("Check the data directory for extracted product data.")
-                print("Check the logs directory for detailed execution logs.")
-                return 0
-            else:
-                print("\n❌ Task 2 failed!")
-                return 1
-                
-        elif run_task == "both":
-            print("🚀 Running Both Tasks: Setup + Product Analysis")
-            
-            # Run Task 1
-            success1 = analyzer.run_initial_setup_demo()
-            
-            if success1:
-                print("✅ Task 1 completed successfully!")
-                
-                # Re-initialize for Task 2 (fresh browser)
-                analyzer.cleanup()
-                analyzer = ECommerceAnalyzer(headless=headless_mode)
-                
-                if not analyzer.initialize_browser():
-                    print("\n❌ Browser re-initialization failed!")
+        with ECommerceAnalyzer(headless=headless_mode, fast=args.fast) as analyzer:
+            if run_task == "extract-url":
+                print("🚀 Running Product Extraction from Specific URL")
+                print(f"URL: {specific_url}")
+
+                products = analyzer.extract_products_from_specific_url(specific_url)
+                if products:
+                    print(f"\n✅ Extraction completed successfully!")
+                    print(f"Extracted {len(products)} products from the main-results div.")
+                    return 0
+                else:
+                    print("\n❌ Extraction failed!")
                     return 1
-                
+
+            elif run_task == "1":
+                print("🚀 Running Task 1: Initial Setup and Navigation")
+                success = analyzer.run_initial_setup_demo()
+                if success:
+                    print("\n✅ Task 1 completed successfully!")
+                    print("Check the logs directory for detailed execution logs.")
+                    return 0
+                else:
+                    print("\n❌ Task 1 failed!")
+                    return 1
+
+            elif run_task == "2":
+                print("🚀 Running Task 2: Product Category Analysis")
+
+                # Browser is already up (context manager); just navigate
                 if not analyzer.navigate_to_target_website():
                     print("\n❌ Website navigation failed!")
                     return 1
-                
+
                 # Run Task 2
-                success2 = analyzer.run_product_category_analysis()
-                
-                if success2:
-                    print("\n✅ Both tasks completed successfully!")
+                success = analyzer.run_product_category_analysis()
+                if success:
+                    print("\n✅ Task 2 completed successfully!")
                     print("Check the data directory for extracted product data.")
                     print("Check the logs directory for detailed execution logs.")
                     return 0
                 else:
-                    print("\n⚠️ Task 1 succeeded, but Task 2 failed!")
+                    print("\n❌ Task 2 failed!")
                     return 1
-            else:
-                print("\n❌ Task 1 failed, skipping Task 2!")
-                return 1
-            
+
+            elif run_task == "both":
+                print("🚀 Running Both Tasks: Setup + Product Analysis")
+
+                # Run Task 1
+                success1 = analyzer.run_initial_setup_demo()
+
+                if success1:
+                    print("✅ Task 1 completed successfully!")
+
+                    # Reuse the Task 1 browser session: a fresh Chrome launch
+                    # costs seconds and the existing driver only needs to be
+                    # pointed back at the homepage
+                    if not analyzer.navigate_to_target_website():
+                        print("\n❌ Website navigation failed!")
+                        return 1
+
+                    # Run Task 2
+                    success2 = analyzer.run_product_category_analysis()
+
+                    if success2:
+                        print("\n✅ Both tasks completed successfully!")
+                        print("Check the data directory for extracted product data.")
+                        print("Check the logs directory for detailed execution logs.")
+                        return 0
+                    else:
+                        print("\n⚠️ Task 1 succeeded, but Task 2 failed!")
+                        return 1
+                else:
+                    print("\n❌ Task 1 failed, skipping Task 2!")
+                    return 1
+
+    except RuntimeError as e:
+        print(f"\n❌ {str(e)}!")
+        return 1
     except KeyboardInterrupt:
         print("\n⚠️ Process interrupted by user")
-        analyzer.cleanup()
         return 1
     except Exception as e:
         print(f"\n💥 Unexpected error: {str(e)}")
-        analyzer.cleanup()
         return 1
-    finally:
-        analyzer.cleanup()
 
 if __name__ == "__main__":
     # Print usage information
@@ -5,19 +5,30 @@ Runs the main extraction script using subprocess for better isolation
 import subprocess
 import sys
 import os
+import threading
 import time
+from collections import deque
 from pathlib import Path
 
+def _stream_pipe(pipe, sink, tail):
+    """Forward a child pipe line by line, keeping a bounded tail"""
+    with pipe:
+        for line in pipe:
+            sink.write(line)
+            sink.flush()
+            tail.append(line)
+
 def run_extraction_programmatically(visible=True, custom_url=None):
     """
     Run the extraction command programmatically using subprocess
-    
+
     Args:
         visible (bool): Whether to run browser in visible mode
         custom_url (str, optional): Custom URL to extract from
-    
+
     Returns:
-        tuple: (success: bool, stdout: str, stderr: str)
+        tuple: (success: bool, stdout: str, stderr: str) — the strings hold
+        the last 1000 lines of each stream; full output is echoed live
     """
     try:
         # Build command arguments
@@ -43,41 +54,59 @@ def run_extraction_programmatically(visible=True, custom_url=None):
         
         # Record start time
         start_time = time.time()
-        
-        # Run the command
-        result = subprocess.run(
+
+        # Stream the child's output as it arrives: a five-minute run no
+        # longer accumulates its whole log in memory, peak cost is one
+        # line plus the bounded tails, and progress shows up live
+        process = subprocess.Popen(
             cmd_args,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1  # Line-buffered
         )
-        
+
+        stdout_tail = deque(maxlen=1000)
+        stderr_tail = deque(maxlen=1000)
+        readers = [
+            threading.Thread(
+                target=_stream_pipe, args=(process.stdout, sys.stdout, stdout_tail),
+                daemon=True
+            ),
+            threading.Thread(
+                target=_stream_pipe, args=(process.stderr, sys.stderr, stderr_tail),
+                daemon=True
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = process.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        for reader in readers:
+            reader.join(timeout=5)
+
         # Calculate execution time
         execution_time = time.time() - start_time
-        
+
         print(f"\n⏱️  Execution completed in {execution_time:.2f} seconds")
-        print(f"🏁 Return code: {result.returncode}")
+        print(f"🏁 Return code: {returncode}")
         print("-" * 60)
-        
-        # Print output
-        if result.stdout:
-            print("📤 STDOUT:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("⚠️  STDERR:")
-            print(result.stderr)
-        
+
         # Determine success
-        success = result.returncode == 0
-        
+        success = returncode == 0
+
         if success:
             print("\n✅ Extraction completed successfully!")
         else:
-            print(f"\n❌ Extraction failed with return code: {result.returncode}")
-        
-        return success, result.stdout, result.stderr
-        
+            print(f"\n❌ Extraction failed with return code: {returncode}")
+
+        return success, "".join(stdout_tail), "".join(stderr_tail)
+
     except subprocess.TimeoutExpired:
         print("\n⏰ Process timed out after 5 minutes")
         return False, "", "Process timed out"
@@ -100,12 +129,11 @@ def run_with_custom_url(url):
 def check_project_files():
     """Check if required project files exist"""
     required_files = ["main.py", "browser_utils.py", "config.py"]
-    missing_files = []
-    
-    for file in required_files:
-        if not Path(file).exists():
-            missing_files.append(file)
-    
+
+    # One directory scan instead of a stat syscall per file
+    present = {entry.name for entry in os.scandir(".") if entry.is_file()}
+    missing_files = [file for file in required_files if file not in present]
+
     if missing_files:
         print(f"❌ Missing required files: {missing_files}")
         return False
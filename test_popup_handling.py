@@ -93,17 +93,24 @@ def test_specific_popup_selectors():
             '.overlay'
         ]
         
-        for indicator in modal_indicators:
-            try:
-                from selenium.webdriver.common.by import By
-                elements = driver.find_elements(By.CSS_SELECTOR, indicator)
-                if elements:
-                    print(f'Found {len(elements)} elements with selector: {indicator}')
-                    for element in elements:
-                        if element.is_displayed():
-                            print(f'  - Visible element: {element.tag_name}')
-            except Exception as e:
-                print(f'Error checking {indicator}: {e}')
+        # One script call evaluates every selector in the page and counts
+        # total/visible matches there (offsetParent check), instead of a
+        # find_elements round-trip per selector plus an is_displayed
+        # round-trip per element
+        try:
+            counts = driver.execute_script(
+                "return arguments[0].map(s => {"
+                "  const els = Array.from(document.querySelectorAll(s));"
+                "  return [els.length, els.filter(e => e.offsetParent !== null).length];"
+                "})",
+                modal_indicators
+            )
+            for indicator, (total, visible) in zip(modal_indicators, counts):
+                if total:
+                    print(f'Found {total} elements with selector: {indicator}'
+                          f' ({visible} visible)')
+        except Exception as e:
+            print(f'Error checking modal indicators: {e}')
         
         browser.close()
         return True
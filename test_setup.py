@@ -1,6 +1,7 @@
 """
 Simple test script to verify the initial setup works correctly
 """
+import os
 import unittest
 import sys
 from pathlib import Path
@@ -68,10 +69,11 @@ def run_quick_test():
         assert config.WEBSITE_CONFIG is not None
         print("   ✓ Configuration loaded")
         
-        # Test 2: ChromeDriver existence
+        # Test 2: ChromeDriver existence (one directory scan, reusable for
+        # any further file checks, instead of a stat per path)
         print("2. Checking ChromeDriver...")
-        chrome_driver_path = Path.cwd() / "chromedriver"
-        assert chrome_driver_path.exists(), "ChromeDriver not found"
+        present = {entry.name for entry in os.scandir(Path.cwd()) if entry.is_file()}
+        assert "chromedriver" in present, "ChromeDriver not found"
         print("   ✓ ChromeDriver found")
         
         # Test 3: Directory creation